@@ -11,17 +11,16 @@ from .routes import register_routes  # src/backend/api/routes.py
 from .middleware import register_middleware  # src/backend/api/middleware/__init__.py
 from .middleware.error_handler import configure_error_handlers  # src/backend/api/middleware/error_handler.py
 from ..logging.structured_logger import StructuredLogger  # src/backend/logging/structured_logger.py
-from ..auth.token_service import TokenService  # src/backend/auth/token_service.py
-from ..auth.user_context_service import UserContextService  # src/backend/auth/user_context_service.py
-from ..auth.site_context_service import SiteContextService  # src/backend/auth/site_context_service.py
+from ..auth import get_token_service, get_user_context_service, get_site_context_service  # src/backend/auth/__init__.py
 
 # Initialize structured logger
 logger = StructuredLogger(__name__)
 
-# Initialize TokenService, UserContextService, and SiteContextService
-token_service = TokenService()
-user_context_service = UserContextService()
-site_context_service = SiteContextService()
+# Use the process-wide TokenService, UserContextService, and SiteContextService, which share
+# one Auth0 client and therefore one in-process JWKS and signing-key cache
+token_service = get_token_service()
+user_context_service = get_user_context_service()
+site_context_service = get_site_context_service()
 
 
 def create_api_blueprint() -> Blueprint:
@@ -10,7 +10,7 @@ from flask import Blueprint, request, jsonify, current_app  # flask 2.3.2
 from marshmallow import ValidationError  # marshmallow 3.20.1
 
 from ...services.user_service import UserService  # UserService class for user management operations
-from ..schemas.user_schemas import UserSchema, UserCreateSchema, UserUpdateSchema, UserProfileSchema, UserSiteSchema, UserListSchema  # Schemas for validating user-related requests and responses
+from ..schemas.user_schemas import UserSchema, UserCreateSchema, UserUpdateSchema, UserProfileSchema, UserSiteSchema, UserListSchema, validate_user_create  # Schemas for validating user-related requests and responses
 from ...auth.site_context_service import SiteContextService  # Service for site context management and validation
 from ..helpers.response import success_response, error_response, validation_error_response, not_found_response, unauthorized_response, forbidden_response, created_response, no_content_response, paginated_response  # Standardized response formatting functions
 from ...logging.audit_logger import AuditLogger, USER_CATEGORY  # Audit logging for user management operations
@@ -135,9 +135,11 @@ def create_user() -> Tuple[Dict[str, Any], int]:
         # Extract request data from request.json
         request_data = request.get_json()
 
-        # Validate request data using UserCreateSchema
-        user_create_schema = UserCreateSchema()
-        validated_data = user_create_schema.load(request_data)
+        # Validate request data with the fast-path validator, falling back to UserCreateSchema
+        validated_data = validate_user_create(request_data)
+        if validated_data is None:
+            user_create_schema = UserCreateSchema()
+            validated_data = user_create_schema.load(request_data)
 
         # Call user_service.create_user with validated data
         user = get_user_service().create_user(validated_data)
@@ -238,7 +238,7 @@ class LoggingMiddleware:
         log_data.update(request_data)
 
         # Log request at INFO level with complete context
-        logger.info(f"Incoming request: {request.method} {request.path}", log_data)
+        logger.info(f"Incoming request: {request.method} {request.path}", extra=log_data)
 
     def log_response(self, response: Response, duration_ms: float, context: Dict[str, Any]):
         """Logs detailed information about the outgoing response
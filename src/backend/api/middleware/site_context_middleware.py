@@ -175,7 +175,7 @@ def requires_site_context(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # Check if site context is established
-        if not hasattr(g, 'site_id') or g.site_id is None:
+        if g.get('site_context') is None:
             logger.warning("Route requires site context but none is set")
             return make_response(jsonify(http_error_response(
                 "Site context required for this operation",
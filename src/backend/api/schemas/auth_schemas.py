@@ -7,14 +7,9 @@ logout, and password reset. They also support the site-scoping access control fe
 from marshmallow import Schema, fields, validates, validates_schema, ValidationError, post_load, post_dump
 # marshmallow version 3.20.1
 from typing import Dict, List, Any, Optional  # standard library
-import re  # standard library
 
 from ...auth.site_context_service import SiteContext
-
-# Regular expressions for validation
-EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-USERNAME_REGEX = re.compile(r'^[a-zA-Z0-9_]{3,50}$')
-PASSWORD_MIN_LENGTH = 10
+from .validators import USERNAME_REGEX, PASSWORD_MIN_LENGTH, VALIDATE_EMAIL, count_password_character_classes
 
 
 class LoginSchema(Schema):
@@ -128,10 +123,7 @@ class PasswordResetRequestSchema(Schema):
         if not email or email.strip() == '':
             raise ValidationError('Email is required')
         
-        if not EMAIL_REGEX.match(email):
-            raise ValidationError('Invalid email format')
-        
-        return email
+        return VALIDATE_EMAIL(email)
 
 
 class PasswordResetConfirmSchema(Schema):
@@ -162,11 +154,7 @@ class PasswordResetConfirmSchema(Schema):
             raise ValidationError(f'Password must be at least {PASSWORD_MIN_LENGTH} characters long')
         
         # Check for password complexity
-        character_types = 0
-        if re.search(r'[A-Z]', password): character_types += 1
-        if re.search(r'[a-z]', password): character_types += 1
-        if re.search(r'[0-9]', password): character_types += 1
-        if re.search(r'[^A-Za-z0-9]', password): character_types += 1
+        character_types = count_password_character_classes(password)
         
         if character_types < 3:
             raise ValidationError('Password must contain at least 3 of the following: uppercase letters, lowercase letters, numbers, and special characters')
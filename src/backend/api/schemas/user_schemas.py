@@ -4,29 +4,63 @@ Includes schemas for user creation, updating, profile access, site association m
 Implements validation rules for user data integrity and enforces site-scoped access control.
 """
 
-from marshmallow import Schema, fields, validates, validates_schema, ValidationError, post_load, pre_load, post_dump
+from marshmallow import Schema, fields, validate, validates, validates_schema, ValidationError, post_load, pre_load, post_dump
 # marshmallow version 3.20.1
+from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 from ...utils.enums import UserRole
-from .auth_schemas import EMAIL_REGEX, USERNAME_REGEX, PASSWORD_MIN_LENGTH
+from .validators import (
+    PASSWORD_CHARACTER_RULES, PASSWORD_MIN_LENGTH, VALIDATE_USERNAME, VALIDATE_EMAIL, VALIDATE_PASSWORD,
+    count_password_character_classes
+)
 
 # Constants for validation
 USERNAME_MIN_LENGTH = 3
 USERNAME_MAX_LENGTH = 50
 EMAIL_MAX_LENGTH = 100
 
+# Keys accepted by UserCreateSchema, used by the hand-written fast-path validator
+USER_CREATE_REQUIRED_FIELDS = ('username', 'email', 'password', 'confirm_password')
+USER_CREATE_FIELDS = frozenset(USER_CREATE_REQUIRED_FIELDS + ('site_ids', 'site_roles'))
+VALID_USER_ROLES = frozenset(role.value for role in UserRole)
+
+
+class FastISODateTime(fields.Field):
+    """
+    ISO-8601 datetime field backed directly by datetime.isoformat/fromisoformat.
+
+    Avoids the generic format dispatch of fields.DateTime for the internal API, where
+    datetimes are always exchanged in ISO-8601 form.
+    """
+    default_error_messages = {"invalid": "Not a valid ISO-8601 datetime."}
+
+    def _serialize(self, value: Optional[datetime], attr: str, obj: Any, **kwargs) -> Optional[str]:
+        """Serialize a datetime to its ISO-8601 string representation."""
+        if value is None:
+            return None
+        return value.isoformat()
+
+    def _deserialize(self, value: Any, attr: Optional[str], data: Any, **kwargs) -> datetime:
+        """Deserialize an ISO-8601 string to a datetime."""
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError) as error:
+            raise self.make_error("invalid") from error
+
 
 class UserSchema(Schema):
     """Schema for complete user serialization and deserialization with all fields."""
     id = fields.Integer()
-    username = fields.String()
-    email = fields.String()
+    username = fields.String(validate=validate.Length(min=1, error="Username is required"))
+    email = fields.String(validate=validate.Length(min=1, error="Email is required"))
     password = fields.String()
-    last_login = fields.DateTime()
-    created_at = fields.DateTime()
-    updated_at = fields.DateTime()
-    sites = fields.List(fields.Nested("SiteSchema", exclude=("users",)))
+    last_login = FastISODateTime()
+    created_at = FastISODateTime()
+    updated_at = FastISODateTime()
+    site_ids = fields.Method("get_site_ids", dump_only=True)
     
     def __init__(self, *args, **kwargs):
         """Initialize the user schema with settings for load and dump operations."""
@@ -36,40 +70,32 @@ class UserSchema(Schema):
         # These fields are read-only and should not be modifiable in requests
         self.dump_only = ['id', 'created_at', 'updated_at', 'last_login']
     
+    def get_site_ids(self, user: Any) -> List[int]:
+        """Serialize the user's site associations as a flat list of site IDs."""
+        return user.get_site_ids()
+    
     @validates('username')
     def validate_username(self, username: str) -> str:
         """Validate username format and uniqueness."""
-        if not username or username.strip() == '':
-            raise ValidationError("Username is required")
-        
         if len(username) < USERNAME_MIN_LENGTH or len(username) > USERNAME_MAX_LENGTH:
             raise ValidationError(f"Username must be between {USERNAME_MIN_LENGTH} and {USERNAME_MAX_LENGTH} characters")
         
-        if not USERNAME_REGEX.match(username):
-            raise ValidationError("Username must contain only letters, numbers, and underscores")
-        
-        return username
+        return VALIDATE_USERNAME(username)
     
     @validates('email')
     def validate_email(self, email: str) -> str:
         """Validate email format and uniqueness."""
-        if not email or email.strip() == '':
-            raise ValidationError("Email is required")
-        
         if len(email) > EMAIL_MAX_LENGTH:
             raise ValidationError(f"Email cannot exceed {EMAIL_MAX_LENGTH} characters")
         
-        if not EMAIL_REGEX.match(email):
-            raise ValidationError("Invalid email format")
-        
-        return email
+        return VALIDATE_EMAIL(email)
 
 
 class UserCreateSchema(Schema):
     """Schema for validating user creation requests with password requirements."""
     username = fields.String(required=True)
     email = fields.String(required=True)
-    password = fields.String(required=True)
+    password = fields.String(required=True, validate=validate.Length(min=1, error="Password is required"))
     confirm_password = fields.String(required=True)
     site_ids = fields.List(fields.Integer(), required=False)
     site_roles = fields.Dict(keys=fields.String(), values=fields.String(), required=False)
@@ -82,29 +108,7 @@ class UserCreateSchema(Schema):
     @validates('password')
     def validate_password(self, password: str) -> str:
         """Validate password complexity requirements."""
-        if not password or password.strip() == '':
-            raise ValidationError("Password is required")
-        
-        if len(password) < PASSWORD_MIN_LENGTH:
-            raise ValidationError(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long")
-        
-        # Check for uppercase letter
-        if not any(char.isupper() for char in password):
-            raise ValidationError("Password must contain at least one uppercase letter")
-        
-        # Check for lowercase letter
-        if not any(char.islower() for char in password):
-            raise ValidationError("Password must contain at least one lowercase letter")
-        
-        # Check for digit
-        if not any(char.isdigit() for char in password):
-            raise ValidationError("Password must contain at least one digit")
-        
-        # Check for special character
-        if not any(not char.isalnum() for char in password):
-            raise ValidationError("Password must contain at least one special character")
-        
-        return password
+        return VALIDATE_PASSWORD(password)
     
     @validates_schema
     def validate_passwords_match(self, data: Dict, **kwargs) -> Dict:
@@ -138,6 +142,53 @@ class UserCreateSchema(Schema):
         return site_roles
 
 
+def _is_complex_password(password: str) -> bool:
+    """Check password length and the shared character rules without raising ValidationError."""
+    return (len(password) >= PASSWORD_MIN_LENGTH
+            and count_password_character_classes(password) == len(PASSWORD_CHARACTER_RULES))
+
+
+def validate_user_create(payload: Any) -> Optional[Dict[str, Any]]:
+    """
+    Fast-path validation of a user creation payload without building a UserCreateSchema.
+
+    Accepts only payloads that UserCreateSchema would load unchanged and returns the
+    cleaned data. Returns None for anything else so the caller can fall back to
+    UserCreateSchema, which remains responsible for producing validation error messages.
+    """
+    if type(payload) is not dict or not USER_CREATE_FIELDS.issuperset(payload):
+        return None
+
+    for field_name in USER_CREATE_REQUIRED_FIELDS:
+        if type(payload.get(field_name)) is not str:
+            return None
+
+    password = payload['password']
+    if not _is_complex_password(password):
+        return None
+    if password != payload['confirm_password']:
+        return None
+
+    cleaned = {field_name: payload[field_name] for field_name in USER_CREATE_REQUIRED_FIELDS}
+
+    if 'site_ids' in payload:
+        site_ids = payload['site_ids']
+        if type(site_ids) is not list or any(type(site_id) is not int for site_id in site_ids):
+            return None
+        cleaned['site_ids'] = site_ids
+
+    if 'site_roles' in payload:
+        site_roles = payload['site_roles']
+        if type(site_roles) is not dict:
+            return None
+        for site_id, role in site_roles.items():
+            if type(site_id) is not str or not site_id.isdecimal() or role not in VALID_USER_ROLES:
+                return None
+        cleaned['site_roles'] = site_roles
+
+    return cleaned
+
+
 class UserUpdateSchema(Schema):
     """Schema for validating user update requests with optional fields."""
     username = fields.String()
@@ -170,24 +221,7 @@ class UserUpdateSchema(Schema):
                 raise ValidationError("Passwords do not match", field_name="confirm_password")
             
             # Validate password complexity
-            if len(password) < PASSWORD_MIN_LENGTH:
-                raise ValidationError(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long")
-            
-            # Check for uppercase letter
-            if not any(char.isupper() for char in password):
-                raise ValidationError("Password must contain at least one uppercase letter")
-            
-            # Check for lowercase letter
-            if not any(char.islower() for char in password):
-                raise ValidationError("Password must contain at least one lowercase letter")
-            
-            # Check for digit
-            if not any(char.isdigit() for char in password):
-                raise ValidationError("Password must contain at least one digit")
-            
-            # Check for special character
-            if not any(not char.isalnum() for char in password):
-                raise ValidationError("Password must contain at least one special character")
+            VALIDATE_PASSWORD(password)
         
         return data
     
@@ -214,17 +248,12 @@ class UserUpdateSchema(Schema):
 
 class UserProfileSchema(Schema):
     """Schema for serializing user profile data without sensitive information."""
-    id = fields.Integer()
-    username = fields.String()
-    email = fields.String()
-    last_login = fields.DateTime()
-    created_at = fields.DateTime()
-    site_ids = fields.List(fields.Integer())
-    
-    def __init__(self, *args, **kwargs):
-        """Initialize the user profile schema."""
-        super().__init__(*args, **kwargs)
-        self.dump_only = ['id', 'username', 'email', 'last_login', 'created_at', 'site_ids']
+    id = fields.Integer(dump_only=True)
+    username = fields.String(dump_only=True)
+    email = fields.String(dump_only=True)
+    last_login = FastISODateTime(dump_only=True)
+    created_at = FastISODateTime(dump_only=True)
+    site_ids = fields.List(fields.Integer(), dump_only=True)
     
     @post_dump
     def format_site_ids(self, data: Dict) -> Dict:
@@ -238,9 +267,9 @@ class UserSiteSchema(Schema):
     """Schema for user-site association data with role information."""
     user_id = fields.Integer(required=True)
     site_id = fields.Integer(required=True)
-    role = fields.String(required=True)
-    created_at = fields.DateTime()
-    updated_at = fields.DateTime()
+    role = fields.String(required=True, validate=validate.Length(min=1, error="Role is required"))
+    created_at = FastISODateTime()
+    updated_at = FastISODateTime()
     
     def __init__(self, *args, **kwargs):
         """Initialize the user-site schema."""
@@ -250,9 +279,6 @@ class UserSiteSchema(Schema):
     @validates('role')
     def validate_role(self, role: str) -> str:
         """Validate that role is a valid UserRole value."""
-        if not role or role.strip() == '':
-            raise ValidationError("Role is required")
-        
         if not UserRole.is_valid(role):
             valid_roles = ", ".join([UserRole.SITE_ADMIN.value, UserRole.EDITOR.value, UserRole.VIEWER.value])
             raise ValidationError(f"Invalid role: {role}. Must be one of: {valid_roles}")
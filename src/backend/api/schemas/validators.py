@@ -0,0 +1,70 @@
+"""
+Shared validators for the API schemas of the Interaction Management System.
+Regular expressions are compiled once at import and wrapped in module-level validator objects,
+so every schema and schema instance reuses the same validators instead of building its own.
+"""
+
+import re  # standard library
+from typing import Callable, Tuple  # standard library
+
+from marshmallow import ValidationError, validate  # marshmallow version 3.20.1
+
+# Regular expressions for validation
+EMAIL_REGEX = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+USERNAME_REGEX = re.compile(r'^[a-zA-Z0-9_]{3,50}$')
+PASSWORD_MIN_LENGTH = 10
+
+# Character class rules every password must satisfy, as (predicate, error message) pairs
+PASSWORD_CHARACTER_RULES: Tuple[Tuple[Callable[[str], bool], str], ...] = (
+    (str.isupper, "Password must contain at least one uppercase letter"),
+    (str.islower, "Password must contain at least one lowercase letter"),
+    (str.isdigit, "Password must contain at least one digit"),
+    (lambda char: not char.isalnum(), "Password must contain at least one special character"),
+)
+
+# Format validators shared by all schemas
+VALIDATE_USERNAME = validate.Regexp(USERNAME_REGEX, error="Username must contain only letters, numbers, and underscores")
+VALIDATE_EMAIL = validate.Regexp(EMAIL_REGEX, error="Invalid email format")
+
+
+def _make_password_validator(min_length: int, rules: Tuple[Tuple[Callable[[str], bool], str], ...]) -> Callable[[str], str]:
+    """
+    Build a password complexity validator bound to a minimum length and character rules.
+
+    Args:
+        min_length: Minimum number of characters in the password
+        rules: Character class rules as (predicate, error message) pairs
+
+    Returns:
+        Validator that returns the password or raises ValidationError
+    """
+    min_length_error = f"Password must be at least {min_length} characters long"
+
+    def validate_password(password: str) -> str:
+        """Validate password length and character classes."""
+        if len(password) < min_length:
+            raise ValidationError(min_length_error)
+
+        for predicate, error in rules:
+            if not any(map(predicate, password)):
+                raise ValidationError(error)
+
+        return password
+
+    return validate_password
+
+
+def count_password_character_classes(password: str) -> int:
+    """
+    Count how many of the password character classes appear in a password.
+
+    Args:
+        password: Password to inspect
+
+    Returns:
+        Number of PASSWORD_CHARACTER_RULES the password satisfies
+    """
+    return sum(1 for predicate, _ in PASSWORD_CHARACTER_RULES if any(map(predicate, password)))
+
+
+VALIDATE_PASSWORD = _make_password_validator(PASSWORD_MIN_LENGTH, PASSWORD_CHARACTER_RULES)
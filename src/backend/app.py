@@ -7,19 +7,9 @@ to create a fully configured backend API server for the Interaction Management S
 import os  # standard library
 
 from flask import Flask, Blueprint  # flask: version 2.3.2
-from flask_cors import CORS  # flask_cors: version 4.0.0
 
 from .config import CONFIG  # src/backend/config.py
-from .extensions import db, jwt, cors, migrate, ma, redis_client  # src/backend/extensions.py
-from .api.routes import register_routes  # src/backend/api/routes.py
-from .api.middleware.auth_middleware import AuthMiddleware  # src/backend/api/middleware/auth_middleware.py
-from .api.middleware.site_context_middleware import SiteContextMiddleware  # src/backend/api/middleware/site_context_middleware.py
-from .api.middleware.error_handler import configure_error_handlers  # src/backend/api/middleware/error_handler.py
-from .auth.auth0 import Auth0Client  # src/backend/auth/auth0.py
-from .auth.token_service import TokenService  # src/backend/auth/token_service.py
-from .auth.user_context_service import UserContextService  # src/backend/auth/user_context_service.py
-from .auth.site_context_service import SiteContextService  # src/backend/auth/site_context_service.py
-from .cache.cache_service import get_cache_service  # src/backend/cache/cache_service.py
+from .extensions import db, jwt, cors, migrate, redis_client  # src/backend/extensions.py
 from .logging.structured_logger import StructuredLogger  # src/backend/logging/structured_logger.py
 
 # Initialize structured logger
@@ -36,6 +26,14 @@ def create_app(config_name: str = None) -> Flask:
     Returns:
         Configured Flask application instance
     """
+    # Routes, middleware and error handlers are imported here rather than at module level so that
+    # processes which import this module without building an app do not pay their import cost;
+    # importing anything under api runs api/__init__, which builds the auth services
+    from .api.routes import register_routes  # src/backend/api/routes.py
+    from .api.middleware.auth_middleware import AuthMiddleware  # src/backend/api/middleware/auth_middleware.py
+    from .api.middleware.site_context_middleware import SiteContextMiddleware  # src/backend/api/middleware/site_context_middleware.py
+    from .api.middleware.error_handler import configure_error_handlers  # src/backend/api/middleware/error_handler.py
+
     # Create Flask application instance with appropriate settings
     app = Flask(__name__)
 
@@ -93,10 +91,6 @@ def create_app(config_name: str = None) -> Flask:
     migrate.init_app(app, db)
     logger.info("Initialized Flask-Migrate")
 
-    # Configure Marshmallow extension
-    ma.init_app(app)
-    logger.info("Initialized Flask-Marshmallow")
-
     # Log successful application creation
     logger.info("Flask application created successfully")
 
@@ -153,24 +147,19 @@ def init_auth_services(app: Flask) -> tuple:
     Returns:
         tuple: Tuple of initialized auth service instances
     """
-    # Initialize Auth0Client instance
-    auth0_client = Auth0Client()
-
-    # Initialize TokenService with auth0_client and cache_service
-    cache_service = get_cache_service()
-    token_service = TokenService(auth0_client=auth0_client)
-
-    # Initialize UserContextService with token_service
-    user_context_service = UserContextService(token_service=token_service)
-
-    # Initialize SiteContextService with token_service
-    site_context_service = SiteContextService(user_context_service=user_context_service)
-
-    # Register JWTManager callbacks for token handling
-    @jwt.user_lookup_loader
-    def user_lookup_callback(_jwt_header, jwt_data):
-        identity = jwt_data["sub"]
-        return identity
+    # Auth modules are heavy to import, so load them only when services are built
+    from .auth import (  # src/backend/auth/__init__.py
+        get_auth0_client,
+        get_token_service,
+        get_user_context_service,
+        get_site_context_service,
+    )
+
+    # Services are process-wide singletons, so repeated app creation reuses them
+    auth0_client = get_auth0_client()
+    token_service = get_token_service()
+    user_context_service = get_user_context_service()
+    site_context_service = get_site_context_service()
 
     logger.info("Initialized authentication services")
 
@@ -7,12 +7,60 @@ features and provides a simplified interface for other modules to interact with
 the authentication system.
 """
 
+from functools import lru_cache
+
 # Import components for re-export
 from .auth0 import Auth0Client
 from .token_service import TokenService
 from .permission_service import PermissionService
 from .user_context_service import UserContext, UserContextService
 from .site_context_service import SiteContext, SiteContextService
+from ..repositories.user_repository import UserRepository
+from ..repositories.site_repository import SiteRepository
 
 # Module version
-__version__ = "1.0.0"
\ No newline at end of file
+__version__ = "1.0.0"
+
+
+@lru_cache(maxsize=1)
+def get_auth0_client() -> Auth0Client:
+    """
+    Get the process-wide Auth0Client instance.
+
+    Returns:
+        Shared Auth0Client instance
+    """
+    return Auth0Client()
+
+
+@lru_cache(maxsize=1)
+def get_token_service() -> TokenService:
+    """
+    Get the process-wide TokenService instance, backed by the shared Auth0 client.
+
+    Returns:
+        Shared TokenService instance
+    """
+    return TokenService(auth0_client=get_auth0_client())
+
+
+@lru_cache(maxsize=1)
+def get_user_context_service() -> UserContextService:
+    """
+    Get the process-wide UserContextService instance.
+
+    Returns:
+        Shared UserContextService instance
+    """
+    return UserContextService(user_repository=UserRepository(), token_service=get_token_service())
+
+
+@lru_cache(maxsize=1)
+def get_site_context_service() -> SiteContextService:
+    """
+    Get the process-wide SiteContextService instance.
+
+    Returns:
+        Shared SiteContextService instance
+    """
+    return SiteContextService(user_context_service=get_user_context_service(), site_repository=SiteRepository())
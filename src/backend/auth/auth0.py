@@ -8,70 +8,234 @@ site-scoped access control.
 """
 
 import jwt  # PyJWT 2.6.0
+from flask import current_app, has_app_context  # flask 2.3.2
+from jwt.algorithms import RSAAlgorithm  # PyJWT 2.6.0
+import orjson  # orjson 3.9.2
 import requests  # requests 2.31.0
-from jose import jwt as jose_jwt  # python-jose 3.3.0
-from typing import Dict, List, Optional, Any, Union
+from requests.adapters import HTTPAdapter  # requests 2.31.0
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass
-import urllib.request
-import json
+import functools
+import re
+import threading
+import time
 
 from ..config import get_env_var, AUTH0_CONFIG
 from ..repositories.user_repository import UserRepository
 from ..utils.error_util import AuthenticationError
+from ..utils.string_util import token_digest
 from ..cache.cache_service import get_cache_service
 from ..logging.structured_logger import StructuredLogger
 
 # Initialize structured logger
 logger = StructuredLogger(__name__)
 
-# JWKS cache time-to-live (1 hour)
+# JWKS cache time-to-live (1 hour), used when Auth0 sends no Cache-Control max-age
 JWKS_CACHE_TTL = 3600
 
+# Extracts the max-age directive from a Cache-Control header
+CACHE_CONTROL_MAX_AGE_REGEX = re.compile(r'max-age=(\d+)')
 
-def get_jwks(domain: str) -> dict:
+# Maximum number of validated token payloads kept in-process by each client
+VALIDATED_TOKEN_CACHE_SIZE = 10000
+
+# Seconds before its actual expiry that a cached management token is treated as expired
+MANAGEMENT_TOKEN_EXPIRY_MARGIN = 300
+
+# Default timeout in seconds for HTTP requests to Auth0
+AUTH0_HTTP_TIMEOUT = 5
+
+# Timeout in seconds for JWKS fetches, which sit on the token validation path
+JWKS_HTTP_TIMEOUT = 3
+
+# Error code of the AuthenticationError raised when Auth0 verification rejects a token,
+# as opposed to failures reaching Auth0 or its JWKS
+INVALID_TOKEN_ERROR_CODE = "INVALID_TOKEN"
+
+# Process-local JWKS cache in front of the shared cache, keyed by domain.
+# Each entry is (monotonic expiry, JWKS, public keys by kid); the RSA key
+# objects are kept in-process only and never serialized to the shared cache.
+_JWKS_LOCAL: Dict[str, Tuple[float, dict, Dict[str, Any]]] = {}
+
+# Per-domain locks so concurrent cache misses result in a single JWKS fetch
+_JWKS_FETCH_LOCKS: Dict[str, threading.Lock] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def get_http_session() -> requests.Session:
     """
-    Retrieves JSON Web Key Set (JWKS) from Auth0 for token validation.
+    Get the process-wide HTTP session used for all Auth0 requests.
     
-    The JWKS contains the public keys used to verify JWT tokens issued by Auth0.
-    This function also caches the JWKS to reduce API calls.
+    The session keeps pooled keep-alive connections, so repeated calls to
+    Auth0 avoid a new TCP and TLS handshake each time.
+    
+    Returns:
+        Shared requests session with a default timeout
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+    session.request = functools.partial(session.request, timeout=AUTH0_HTTP_TIMEOUT)
+    return session
+
+
+def _build_public_keys(jwks: dict, previous_entry: Optional[Tuple[float, dict, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """
+    Convert the RSA keys of a JWKS into public key objects indexed by key ID.
+    
+    Key objects from the previous cache entry are reused for any key whose
+    JWK is unchanged, so a JWKS refresh only constructs keys that rotated in.
+    
+    Args:
+        jwks: JWKS dictionary from Auth0
+        previous_entry: Expired process-local cache entry for the same domain, if any
+        
+    Returns:
+        Dictionary mapping key IDs to RSA public key objects
+    """
+    previous_jwks = {}
+    previous_keys = {}
+    if previous_entry:
+        previous_jwks = {jwk.get('kid'): jwk for jwk in previous_entry[1].get('keys', [])}
+        previous_keys = previous_entry[2]
+    
+    public_keys = {}
+    for jwk in jwks.get('keys', []):
+        kid = jwk.get('kid')
+        if not kid or jwk.get('kty') != 'RSA':
+            continue
+        if kid in previous_keys and previous_jwks.get(kid) == jwk:
+            public_keys[kid] = previous_keys[kid]
+        else:
+            public_keys[kid] = RSAAlgorithm.from_jwk(jwk)
+    return public_keys
+
+
+def _fetch_jwks(domain: str) -> Tuple[dict, int]:
+    """
+    Fetch the JWKS for a domain from Auth0.
+    
+    The cache lifetime follows the max-age of the response's Cache-Control
+    header, falling back to JWKS_CACHE_TTL when none is given.
     
     Args:
         domain: Auth0 domain name
         
     Returns:
-        JWKS dictionary containing public keys
+        Tuple of (JWKS dictionary containing public keys, cache TTL in seconds)
         
     Raises:
         AuthenticationError: If unable to retrieve JWKS
     """
-    cache_service = get_cache_service()
-    cache_key = f"jwks:{domain}"
-    
-    # Try to get JWKS from cache first
-    jwks = cache_service.get(cache_key, data_type='json')
-    if jwks:
-        logger.debug(f"Retrieved JWKS from cache for domain {domain}")
-        return jwks
-    
     try:
-        # If not in cache, fetch from Auth0
         jwks_url = f"https://{domain}/.well-known/jwks.json"
         logger.debug(f"Fetching JWKS from {jwks_url}")
         
-        with urllib.request.urlopen(jwks_url) as response:
-            jwks = json.loads(response.read().decode('utf-8'))
+        response = get_http_session().get(jwks_url, timeout=JWKS_HTTP_TIMEOUT)
+        response.raise_for_status()
         
-        # Cache the JWKS
-        cache_service.set(cache_key, jwks, JWKS_CACHE_TTL)
-        logger.debug(f"Cached JWKS for domain {domain}")
+        ttl = JWKS_CACHE_TTL
+        max_age = CACHE_CONTROL_MAX_AGE_REGEX.search(response.headers.get('Cache-Control', ''))
+        if max_age and int(max_age.group(1)) > 0:
+            ttl = int(max_age.group(1))
         
-        return jwks
+        return orjson.loads(response.content), ttl
     except Exception as e:
         error_message = f"Failed to retrieve JWKS from {domain}: {str(e)}"
         logger.error(error_message)
         raise AuthenticationError(error_message)
 
 
+def _get_jwks_entry(domain: str) -> Tuple[float, dict, Dict[str, Any]]:
+    """
+    Get the process-local JWKS cache entry for a domain, loading it on a miss.
+    
+    Lookups go to the process-local cache first, then the shared cache, and
+    only then to Auth0.
+    
+    Args:
+        domain: Auth0 domain name
+        
+    Returns:
+        Tuple of (monotonic expiry, JWKS, public keys by kid)
+        
+    Raises:
+        AuthenticationError: If unable to retrieve JWKS
+    """
+    entry = _JWKS_LOCAL.get(domain)
+    if entry and time.monotonic() < entry[0]:
+        return entry
+    
+    # dict.setdefault is atomic, so all threads agree on one lock per domain
+    with _JWKS_FETCH_LOCKS.setdefault(domain, threading.Lock()):
+        # Another thread may have populated the entry while we waited
+        entry = _JWKS_LOCAL.get(domain)
+        if entry and time.monotonic() < entry[0]:
+            return entry
+        
+        cache_service = get_cache_service()
+        cache_key = f"jwks:{domain}"
+        
+        # Try to get JWKS from the shared cache before going to Auth0
+        jwks = cache_service.get(cache_key, data_type='json')
+        ttl = JWKS_CACHE_TTL
+        if jwks:
+            logger.debug(f"Retrieved JWKS from cache for domain {domain}")
+        else:
+            jwks, ttl = _fetch_jwks(domain)
+            
+            # Cache the JWKS for as long as Auth0 allows
+            cache_service.set(cache_key, jwks, ttl)
+            logger.debug(f"Cached JWKS for domain {domain} for {ttl} seconds")
+        
+        entry = (time.monotonic() + ttl, jwks, _build_public_keys(jwks, entry))
+        _JWKS_LOCAL[domain] = entry
+        return entry
+
+
+def get_jwks(domain: str) -> dict:
+    """
+    Retrieves JSON Web Key Set (JWKS) from Auth0 for token validation.
+    
+    The JWKS contains the public keys used to verify JWT tokens issued by Auth0.
+    This function also caches the JWKS, in-process and in the shared cache,
+    to reduce API calls.
+    
+    Args:
+        domain: Auth0 domain name
+        
+    Returns:
+        JWKS dictionary containing public keys
+        
+    Raises:
+        AuthenticationError: If unable to retrieve JWKS
+    """
+    return _get_jwks_entry(domain)[1]
+
+
+def get_signing_key(domain: str, kid: str) -> Any:
+    """
+    Get the RSA public key for a key ID from the Auth0 JWKS.
+    
+    Keys are converted from JWK form once per JWKS refresh and reused for
+    every verification in this process until the entry expires.
+    
+    Args:
+        domain: Auth0 domain name
+        kid: Key ID from the token header
+        
+    Returns:
+        RSA public key object for signature verification
+        
+    Raises:
+        AuthenticationError: If no key with the given ID is published
+    """
+    public_key = _get_jwks_entry(domain)[2].get(kid)
+    if public_key is None:
+        raise AuthenticationError("Unable to find appropriate key in JWKS")
+    return public_key
+
+
 class Auth0Client:
     """
     Client for Auth0 authentication service with methods for authentication,
@@ -95,6 +259,41 @@ class Auth0Client:
         self._client_secret = AUTH0_CONFIG.get('client_secret')
         self._audience = AUTH0_CONFIG.get('api_audience')
         self._scope = "openid profile email"
+        self._app_metadata_claim = AUTH0_CONFIG.get('app_metadata_claim')
+        
+        # Precompute Auth0 endpoint URLs and static request payloads
+        self._issuer = f"https://{self._domain}/"
+        self._token_url = f"https://{self._domain}/oauth/token"
+        self._userinfo_url = f"https://{self._domain}/userinfo"
+        self._mgmt_api_audience = f"https://{self._domain}/api/v2/"
+        self._mgmt_users_url = f"{self._mgmt_api_audience}users/"
+        self._password_grant_payload = {
+            'grant_type': 'password',
+            'client_id': self._client_id,
+            'client_secret': self._client_secret,
+            'scope': self._scope,
+            'audience': self._audience
+        }
+        self._refresh_grant_payload = {
+            'grant_type': 'refresh_token',
+            'client_id': self._client_id,
+            'client_secret': self._client_secret
+        }
+        self._client_creds_payload = {
+            'grant_type': 'client_credentials',
+            'client_id': self._client_id,
+            'client_secret': self._client_secret,
+            'audience': self._mgmt_api_audience
+        }
+        
+        # Precompute token verification arguments shared by every decode
+        self._verify_algorithms = AUTH0_CONFIG.get('algorithms', ['RS256'])
+        self._verify_options = {
+            'require': ['exp', 'iat', 'aud', 'iss'],
+            'verify_exp': True,
+            'verify_aud': True,
+            'verify_iss': True
+        }
         
         # Store user repository for local user management
         self._user_repository = user_repository
@@ -102,6 +301,17 @@ class Auth0Client:
         # Get cache service for token and user info caching
         self._cache_service = get_cache_service()
         
+        # Shared HTTP session so calls to Auth0 reuse pooled keep-alive connections
+        self._http = get_http_session()
+        
+        # In-process Management API token and its monotonic expiry
+        self._mgmt_token: Optional[str] = None
+        self._mgmt_token_exp: float = 0.0
+        
+        # In-process LRU of validated token payloads, keyed by token digest
+        self._token_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+        
         logger.info(f"Initialized Auth0 client for domain: {self._domain}")
     
     def authenticate(self, username: str, password: str) -> Dict[str, Any]:
@@ -126,39 +336,36 @@ class Auth0Client:
             logger.debug(f"Authenticating user: {username}")
             
             # Prepare authentication request payload
-            payload = {
-                'grant_type': 'password',
-                'client_id': self._client_id,
-                'client_secret': self._client_secret,
-                'username': username,
-                'password': password,
-                'scope': self._scope,
-                'audience': self._audience
-            }
+            payload = {**self._password_grant_payload, 'username': username, 'password': password}
             
             # Send authentication request to Auth0
-            url = f"https://{self._domain}/oauth/token"
-            response = requests.post(url, json=payload)
+            response = self._http.post(self._token_url, json=payload)
+            
+            # Parse the response body once for both the error and success branches
+            token_data = orjson.loads(response.content)
             
             # Check for successful response
-            if response.status_code != 200:
-                error_data = response.json()
-                error_message = error_data.get('error_description', 'Authentication failed')
+            if response.status_code >= 300:
+                error_message = token_data.get('error_description', 'Authentication failed')
                 logger.warning(f"Authentication failed for user {username}: {error_message}")
                 raise AuthenticationError(error_message)
             
             # Extract tokens from response
-            token_data = response.json()
             access_token = token_data.get('access_token')
             id_token = token_data.get('id_token')
             refresh_token = token_data.get('refresh_token')
             
             # Decode the ID token to get user information
-            user_info = jwt.decode(id_token, options={"verify_signature": False})
+            user_info = self._decode_id_token(id_token)
             user_id = user_info.get('sub')
             
-            # Get user's site access permissions
-            site_access = self.get_site_access_for_user(user_id, user_info)
+            # Get user's site access permissions, straight from the verified ID token when it grants any;
+            # an empty claim list falls through so the local database can still supply the sites
+            site_access = self._get_site_access_from_claims(user_info)
+            if site_access:
+                self._cache_service.store_user_site_access(user_id, site_access, 3600)  # Cache for 1 hour
+            else:
+                site_access = self.get_site_access_for_user(user_id, user_info)
             
             # Cache tokens
             self._cache_service.store_auth_token(user_id, access_token, token_data.get('expires_in', 3600))
@@ -210,53 +417,48 @@ class Auth0Client:
             Decoded token payload if valid
             
         Raises:
-            AuthenticationError: If token is invalid or expired
+            AuthenticationError: If token is invalid or expired, with error_code
+                INVALID_TOKEN_ERROR_CODE, or if it could not be verified
         """
         try:
-            # Check if token is already validated and cached
-            cache_key = f"validated_token:{token[:64]}"  # Use partial token as key for security
-            cached_payload = self._cache_service.get(cache_key, data_type='json')
+            # Check if token is already validated and cached in-process
+            digest = token_digest(token)
+            cached_payload = self._get_cached_payload(digest)
             if cached_payload:
-                logger.debug("Token validation successful (cached)")
+                logger.debug("Token validation successful (cached in-process)")
                 return cached_payload
             
-            # Get JWKS for token validation
-            jwks = get_jwks(self._domain)
+            # Fall back to the shared cache
+            cache_key = f"validated_token:{digest.hex()}"
+            cached_payload = self._cache_service.get(cache_key, data_type='json')
+            if cached_payload and cached_payload.get('exp', 0) > time.time():
+                self._cache_payload(digest, cached_payload)
+                logger.debug("Token validation successful (cached)")
+                return cached_payload
             
-            # Extract header data from token
-            header = jwt.get_unverified_header(token)
-            kid = header.get('kid')
+            # Extract key ID from token header
+            kid = jwt.get_unverified_header(token).get('kid')
             
             if not kid:
-                raise AuthenticationError("Invalid token header: No 'kid' present")
-            
-            # Find the right key in the JWKS
-            rsa_key = None
-            for key in jwks.get('keys', []):
-                if key.get('kid') == kid:
-                    rsa_key = {
-                        'kty': key.get('kty'),
-                        'kid': key.get('kid'),
-                        'use': key.get('use'),
-                        'n': key.get('n'),
-                        'e': key.get('e')
-                    }
-                    break
-            
-            if not rsa_key:
-                raise AuthenticationError("Unable to find appropriate key in JWKS")
+                raise AuthenticationError("Invalid token header: No 'kid' present",
+                                          error_code=INVALID_TOKEN_ERROR_CODE)
+            
+            # Get the prebuilt RSA public key for token validation
+            public_key = get_signing_key(self._domain, kid)
             
             # Verify the token
             try:
-                payload = jose_jwt.decode(
+                payload = jwt.decode(
                     token,
-                    rsa_key,
-                    algorithms=AUTH0_CONFIG.get('algorithms', ['RS256']),
+                    key=public_key,
+                    algorithms=self._verify_algorithms,
                     audience=self._audience,
-                    issuer=f"https://{self._domain}/"
+                    issuer=self._issuer,
+                    options=self._verify_options
                 )
                 
                 # Cache the validated token payload
+                self._cache_payload(digest, payload)
                 ttl = payload.get('exp', 0) - payload.get('iat', 0)
                 if ttl > 0:
                     self._cache_service.set(cache_key, payload, ttl)
@@ -264,21 +466,98 @@ class Auth0Client:
                 logger.debug("Token validation successful")
                 return payload
                 
-            except jose_jwt.ExpiredSignatureError:
-                raise AuthenticationError("Token has expired")
-            except jose_jwt.JWTClaimsError as claims_error:
-                raise AuthenticationError(f"Invalid claims: {str(claims_error)}")
+            except jwt.ExpiredSignatureError:
+                raise AuthenticationError("Token has expired", error_code=INVALID_TOKEN_ERROR_CODE)
+            except (jwt.InvalidAudienceError, jwt.InvalidIssuerError,
+                    jwt.MissingRequiredClaimError, jwt.ImmatureSignatureError) as claims_error:
+                raise AuthenticationError(f"Invalid claims: {str(claims_error)}",
+                                          error_code=INVALID_TOKEN_ERROR_CODE)
             except Exception as e:
-                raise AuthenticationError(f"Invalid token: {str(e)}")
+                raise AuthenticationError(f"Invalid token: {str(e)}", error_code=INVALID_TOKEN_ERROR_CODE)
                 
         except AuthenticationError:
             # Re-raise authentication errors
             raise
+        except jwt.InvalidTokenError as e:
+            # Malformed token header
+            raise AuthenticationError(f"Invalid token: {str(e)}", error_code=INVALID_TOKEN_ERROR_CODE)
         except Exception as e:
             error_message = f"Error validating token: {str(e)}"
             logger.error(error_message)
             raise AuthenticationError(error_message)
     
+    def _decode_id_token(self, id_token: str) -> Dict[str, Any]:
+        """
+        Verify an Auth0 ID token and return its claims.
+        
+        Uses the same cached JWKS signing keys as access token validation. ID
+        tokens are issued for this application, so the audience is the client ID.
+        
+        Args:
+            id_token: ID token returned by Auth0
+            
+        Returns:
+            Verified ID token claims
+            
+        Raises:
+            AuthenticationError: If the ID token cannot be verified
+        """
+        kid = jwt.get_unverified_header(id_token).get('kid')
+        if not kid:
+            raise AuthenticationError("Invalid ID token header: No 'kid' present")
+        
+        try:
+            return jwt.decode(
+                id_token,
+                key=get_signing_key(self._domain, kid),
+                algorithms=self._verify_algorithms,
+                audience=self._client_id,
+                issuer=self._issuer,
+                options=self._verify_options
+            )
+        except jwt.InvalidTokenError as e:
+            raise AuthenticationError(f"Invalid ID token: {str(e)}")
+    
+    def _get_cached_payload(self, token_digest: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Get a validated token payload from the in-process cache.
+        
+        Entries whose token has expired are evicted instead of returned.
+        
+        Args:
+            token_digest: Digest of the token
+            
+        Returns:
+            Cached token payload, or None if absent or expired
+        """
+        with self._token_cache_lock:
+            payload = self._token_cache.get(token_digest)
+            if payload is None:
+                return None
+            
+            if payload['exp'] <= time.time():
+                del self._token_cache[token_digest]
+                return None
+            
+            self._token_cache.move_to_end(token_digest)
+            return payload
+    
+    def _cache_payload(self, token_digest: bytes, payload: Dict[str, Any]) -> None:
+        """
+        Store a validated token payload in the in-process cache.
+        
+        The least recently used entry is evicted once the cache is full.
+        
+        Args:
+            token_digest: Digest of the token
+            payload: Verified token payload
+        """
+        with self._token_cache_lock:
+            self._token_cache[token_digest] = payload
+            self._token_cache.move_to_end(token_digest)
+            if len(self._token_cache) > VALIDATED_TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+    
     def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """
         Get detailed user profile information from Auth0.
@@ -297,24 +576,23 @@ class Auth0Client:
         """
         try:
             # Check if user info is cached
-            cache_key = f"user_info:{access_token[:64]}"  # Use partial token as key for security
+            cache_key = f"user_info:{token_digest(access_token).hex()}"
             cached_info = self._cache_service.get(cache_key, data_type='json')
             if cached_info:
                 logger.debug("Retrieved user info from cache")
                 return cached_info
             
             # Get user info from Auth0
-            url = f"https://{self._domain}/userinfo"
             headers = {"Authorization": f"Bearer {access_token}"}
             
-            response = requests.get(url, headers=headers)
+            response = self._http.get(self._userinfo_url, headers=headers)
             
-            if response.status_code != 200:
+            if response.status_code >= 300:
                 error_message = f"Failed to retrieve user info: {response.text}"
                 logger.error(error_message)
                 raise AuthenticationError(error_message)
             
-            user_info = response.json()
+            user_info = orjson.loads(response.content)
             
             # Cache user info
             self._cache_service.set(cache_key, user_info, 3600)  # Cache for 1 hour
@@ -347,31 +625,26 @@ class Auth0Client:
             logger.debug("Refreshing access token")
             
             # Prepare refresh token request payload
-            payload = {
-                'grant_type': 'refresh_token',
-                'client_id': self._client_id,
-                'client_secret': self._client_secret,
-                'refresh_token': refresh_token
-            }
+            payload = {**self._refresh_grant_payload, 'refresh_token': refresh_token}
             
             # Send refresh token request to Auth0
-            url = f"https://{self._domain}/oauth/token"
-            response = requests.post(url, json=payload)
+            response = self._http.post(self._token_url, json=payload)
+            
+            # Parse the response body once for both the error and success branches
+            token_data = orjson.loads(response.content)
             
             # Check for successful response
-            if response.status_code != 200:
-                error_data = response.json()
-                error_message = error_data.get('error_description', 'Token refresh failed')
+            if response.status_code >= 300:
+                error_message = token_data.get('error_description', 'Token refresh failed')
                 logger.warning(f"Token refresh failed: {error_message}")
                 raise AuthenticationError(error_message)
             
             # Extract new tokens from response
-            token_data = response.json()
             new_access_token = token_data.get('access_token')
             new_id_token = token_data.get('id_token')
             
             # Decode the ID token to get user information
-            user_info = jwt.decode(new_id_token, options={"verify_signature": False})
+            user_info = self._decode_id_token(new_id_token)
             user_id = user_info.get('sub')
             
             # Cache new access token
@@ -417,23 +690,14 @@ class Auth0Client:
             AuthenticationError: If unable to retrieve site access
         """
         try:
-            # Check if site access is cached
-            cache_key = f"user:{user_id}:site_access"
-            cached_sites = self._cache_service.get(cache_key, data_type='json')
-            if cached_sites:
+            # Check if site access is cached, under the same key it is stored with
+            cached_sites = self._cache_service.get_user_site_access(user_id)
+            if cached_sites is not None:
                 logger.debug(f"Retrieved site access from cache for user {user_id}")
                 return cached_sites
             
-            site_ids = []
-            
             # First check if site access is in Auth0 user metadata
-            if user_data and 'app_metadata' in user_data:
-                app_metadata = user_data.get('app_metadata', {})
-                site_access = app_metadata.get('site_access', [])
-                if isinstance(site_access, list):
-                    # Convert string IDs to integers if needed
-                    site_ids = [int(site_id) if isinstance(site_id, str) else site_id 
-                               for site_id in site_access]
+            site_ids = self._get_site_access_from_claims(user_data) or []
             
             # If no site access in Auth0 metadata and we have a user repository, check local database
             if not site_ids and self._user_repository:
@@ -448,8 +712,8 @@ class Auth0Client:
                     site_ids = local_user.get_site_ids()
                     logger.debug(f"Retrieved site access from local database for user {user_id}")
                     
-                    # Optionally synchronize this back to Auth0
-                    self.sync_user_site_access(user_id)
+                    # Synchronize this back to Auth0 without blocking the caller
+                    self.sync_user_site_access_async(user_id)
             
             # Cache the site access
             self._cache_service.store_user_site_access(user_id, site_ids, 3600)  # Cache for 1 hour
@@ -464,6 +728,33 @@ class Auth0Client:
             logger.warning("Returning empty site access list due to error")
             return []
     
+    def _get_site_access_from_claims(self, user_data: Optional[Dict[str, Any]]) -> Optional[List[int]]:
+        """
+        Extract site access from Auth0 app_metadata in token claims or profile data.
+        
+        Looks for app_metadata under the configured namespaced ID token claim,
+        then under the plain 'app_metadata' key used by Management API profiles.
+        
+        Args:
+            user_data: Auth0 ID token claims or user profile
+            
+        Returns:
+            List of site IDs, or None if the data carries no site access
+        """
+        if not user_data:
+            return None
+        
+        app_metadata = user_data.get(self._app_metadata_claim) or user_data.get('app_metadata')
+        if not app_metadata:
+            return None
+        
+        site_access = app_metadata.get('site_access')
+        if not isinstance(site_access, list):
+            return None
+        
+        # New writes store integers, but metadata written earlier may still hold string IDs
+        return list(map(int, site_access))
+    
     def update_user_metadata(self, user_id: str, metadata: Dict[str, Any]) -> bool:
         """
         Update user metadata in Auth0, including site access information.
@@ -488,20 +779,23 @@ class Auth0Client:
             token = self.get_management_token()
             
             # Prepare update request
-            url = f"https://{self._domain}/api/v2/users/{user_id}"
+            url = f"{self._mgmt_users_url}{user_id}"
             headers = {
                 "Authorization": f"Bearer {token}",
                 "Content-Type": "application/json"
             }
+            # Normalize site access to integers at the write boundary so readers can trust it
+            if 'site_access' in metadata:
+                metadata = {**metadata, 'site_access': [int(site_id) for site_id in metadata['site_access']]}
             payload = {
                 "app_metadata": metadata
             }
             
             # Send update request to Auth0
-            response = requests.patch(url, headers=headers, json=payload)
+            response = self._http.patch(url, headers=headers, json=payload)
             
             # Check for successful response
-            if response.status_code not in (200, 201):
+            if response.status_code >= 300:
                 error_message = f"Failed to update user metadata: {response.text}"
                 logger.error(error_message)
                 raise AuthenticationError(error_message)
@@ -517,6 +811,46 @@ class Auth0Client:
             logger.error(error_message)
             raise AuthenticationError(error_message)
     
+    def normalize_site_access_metadata(self, user_id: str) -> bool:
+        """
+        Rewrite a user's Auth0 site access metadata with integer site IDs.
+        
+        One-time migration helper for metadata written before site access was
+        normalized on write; readers still convert the stored IDs to integers.
+        
+        Args:
+            user_id: User identifier from Auth0
+            
+        Returns:
+            True if the metadata was rewritten, False if it was already normalized
+            
+        Raises:
+            AuthenticationError: If unable to read or update the metadata
+        """
+        try:
+            token = self.get_management_token()
+            url = f"{self._mgmt_users_url}{user_id}"
+            response = self._http.get(url, headers={"Authorization": f"Bearer {token}"})
+            
+            if response.status_code >= 300:
+                error_message = f"Failed to retrieve user {user_id}: {response.text}"
+                logger.error(error_message)
+                raise AuthenticationError(error_message)
+            
+            site_access = orjson.loads(response.content).get('app_metadata', {}).get('site_access')
+            if not isinstance(site_access, list) or all(type(site_id) is int for site_id in site_access):
+                return False
+            
+            logger.info(f"Normalizing site access metadata for user {user_id}")
+            return self.update_user_metadata(user_id, {"site_access": site_access})
+            
+        except AuthenticationError:
+            raise
+        except Exception as e:
+            error_message = f"Error normalizing site access metadata: {str(e)}"
+            logger.error(error_message)
+            raise AuthenticationError(error_message)
+    
     def get_management_token(self) -> str:
         """
         Get an access token for Auth0 Management API.
@@ -531,39 +865,40 @@ class Auth0Client:
             AuthenticationError: If unable to obtain management token
         """
         try:
-            # Check if management token is cached
+            # Check the in-process token first
+            if self._mgmt_token and time.monotonic() < self._mgmt_token_exp:
+                return self._mgmt_token
+            
+            # Fall back to a token another process cached. Its remaining lifetime is
+            # unknown but at least the expiry margin, so hold it locally for that long.
             cache_key = "auth0:management_token"
             cached_token = self._cache_service.get(cache_key, data_type='str')
             if cached_token:
                 logger.debug("Retrieved management token from cache")
+                self._mgmt_token = cached_token
+                self._mgmt_token_exp = time.monotonic() + MANAGEMENT_TOKEN_EXPIRY_MARGIN
                 return cached_token
             
-            # Prepare token request payload
-            payload = {
-                'grant_type': 'client_credentials',
-                'client_id': self._client_id,
-                'client_secret': self._client_secret,
-                'audience': f"https://{self._domain}/api/v2/"
-            }
+            # Send token request to Auth0 with the static client credentials payload
+            response = self._http.post(self._token_url, json=self._client_creds_payload)
             
-            # Send token request to Auth0
-            url = f"https://{self._domain}/oauth/token"
-            response = requests.post(url, json=payload)
+            # Parse the response body once for both the error and success branches
+            token_data = orjson.loads(response.content)
             
             # Check for successful response
-            if response.status_code != 200:
-                error_data = response.json()
-                error_message = error_data.get('error_description', 'Management token request failed')
+            if response.status_code >= 300:
+                error_message = token_data.get('error_description', 'Management token request failed')
                 logger.error(error_message)
                 raise AuthenticationError(error_message)
             
             # Extract token from response
-            token_data = response.json()
             access_token = token_data.get('access_token')
             expires_in = token_data.get('expires_in', 86400)  # Default to 24 hours
             
-            # Cache the token
-            self._cache_service.set(cache_key, access_token, expires_in - 300)  # Expire 5 minutes early
+            # Cache the token in-process and write through for other processes, expiring it early
+            self._mgmt_token = access_token
+            self._mgmt_token_exp = time.monotonic() + expires_in - MANAGEMENT_TOKEN_EXPIRY_MARGIN
+            self._cache_service.set(cache_key, access_token, expires_in - MANAGEMENT_TOKEN_EXPIRY_MARGIN)
             
             logger.info("Obtained Auth0 Management API token")
             return access_token
@@ -573,6 +908,30 @@ class Auth0Client:
             logger.error(error_message)
             raise AuthenticationError(error_message)
     
+    def sync_user_site_access_async(self, user_id: str) -> None:
+        """
+        Synchronize user's site access to Auth0 on a background thread.
+        
+        The caller already has the site IDs from the local database, and Auth0
+        metadata only needs to converge eventually, so the Management API
+        round-trips are kept off the request path. The thread runs inside the
+        current application context so the user repository stays usable.
+        
+        Args:
+            user_id: User identifier from Auth0
+        """
+        app = current_app._get_current_object() if has_app_context() else None
+        
+        def run_sync() -> None:
+            if app is None:
+                self.sync_user_site_access(user_id)
+                return
+            with app.app_context():
+                self.sync_user_site_access(user_id)
+        
+        threading.Thread(target=run_sync, name="auth0-site-access-sync", daemon=True).start()
+        logger.debug(f"Scheduled background site access sync for user {user_id}")
+    
     def sync_user_site_access(self, user_id: str) -> bool:
         """
         Synchronize user's site access between local database and Auth0.
@@ -601,12 +960,12 @@ class Auth0Client:
             try:
                 # Try to get user info from Auth0
                 management_token = self.get_management_token()
-                url = f"https://{self._domain}/api/v2/users/{user_id}"
+                url = f"{self._mgmt_users_url}{user_id}"
                 headers = {"Authorization": f"Bearer {management_token}"}
                 
-                response = requests.get(url, headers=headers)
-                if response.status_code == 200:
-                    user_info = response.json()
+                response = self._http.get(url, headers=headers)
+                if response.status_code < 300:
+                    user_info = orjson.loads(response.content)
             except Exception as e:
                 logger.warning(f"Could not retrieve user info from Auth0: {str(e)}")
             
@@ -7,18 +7,91 @@ enforce proper access control across the application.
 """
 
 import jwt  # version 2.6.0
-from typing import Dict, List, Optional, Any
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
-from ..utils.datetime_util import get_utc_now, add_time_delta
+import orjson  # version 3.9.2
+
 from ..utils.constants import JWT_SECRET, JWT_ALGORITHM, JWT_TOKEN_LIFETIME_MINUTES, JWT_REFRESH_LIFETIME_DAYS
-from .auth0 import Auth0Client
+from .auth0 import Auth0Client, INVALID_TOKEN_ERROR_CODE
 from ..cache.cache_service import CacheService
 from ..cache.cache_keys import TOKEN_BLACKLIST, TOKEN_PAYLOAD
+from ..utils.error_util import AuthenticationError
 
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+# Signing key and accepted algorithms, prepared once instead of on every encode/decode
+_SECRET_KEY = JWT_SECRET.encode('utf-8')
+_DECODE_ALGORITHMS = [JWT_ALGORITHM]
+
+# In-process validation cache: maximum entries, lifetime of a validated entry (bounds how long
+# a token blacklisted on another instance stays usable here), and lifetime of a rejected entry
+LOCAL_TOKEN_CACHE_SIZE = 10000
+LOCAL_TOKEN_CACHE_TTL = 60
+LOCAL_TOKEN_NEGATIVE_TTL = 10
+
+# Longest token accepted for validation; anything larger is rejected before any lookup
+MAX_TOKEN_LENGTH = 8192
+
+# Site IDs below this bound are packed into a bitmask claim instead of a JSON array
+SITES_MASK_MAX_BITS = 4096
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    """Base64url-encodes bytes without padding, as used for JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+
+# Encoded JWT header, identical for every token this service issues
+_JWT_HEADER_SEGMENT = _b64url_encode(orjson.dumps({'alg': JWT_ALGORITHM, 'typ': 'JWT'}))
+
+
+def _decode_unverified(token: str) -> Dict[str, Any]:
+    """Decodes a JWT payload segment without verifying the signature or claims."""
+    _, payload_segment, _ = token.split('.', 2)
+    return orjson.loads(base64.urlsafe_b64decode(payload_segment + '=' * (-len(payload_segment) % 4)))
+
+
+def _token_cache_key(prefix: str, token: str) -> str:
+    """Builds a fixed-size shared cache key for a token from a 16-byte BLAKE2b digest."""
+    return f"{prefix}:{hashlib.blake2b(token.encode('utf-8'), digest_size=16).hexdigest()}"
+
+
+def _local_token_key(token: str) -> bytes:
+    """Derives the in-process cache key for a token as a keyed 16-byte BLAKE2b digest."""
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16, key=_SECRET_KEY[:64]).digest()
+
+
+def _encode_site_mask(site_ids: List[int]) -> str:
+    """Packs site IDs into a base64url bitmask where bit N is set for site N."""
+    mask = 0
+    for site_id in site_ids:
+        mask |= 1 << site_id
+    return _b64url_encode(mask.to_bytes((mask.bit_length() + 7) // 8, 'big')).decode('ascii')
+
+
+def _decode_site_mask(encoded: str) -> int:
+    """Unpacks a base64url site bitmask produced by _encode_site_mask."""
+    return int.from_bytes(base64.urlsafe_b64decode(encoded + '=' * (-len(encoded) % 4)), 'big')
+
+
+def _site_mask_ids(mask: int) -> List[int]:
+    """Lists the site IDs set in a bitmask, visiting only the set bits."""
+    site_ids = []
+    while mask:
+        low_bit = mask & -mask
+        site_ids.append(low_bit.bit_length() - 1)
+        mask ^= low_bit
+    return site_ids
+
+
 class JWTService:
     """Service class to handle JWT token operations for authentication and authorization"""
     
@@ -32,6 +105,32 @@ class JWTService:
         """
         self._auth0_client = auth0_client
         self._cache_service = cache_service
+        
+        # Keyed HMAC template for HS256 signing; each token copies the template so the
+        # key schedule is computed once per service instead of per token
+        self._hmac_template = hmac.new(_SECRET_KEY, digestmod=hashlib.sha256) if JWT_ALGORITHM == 'HS256' else None
+        
+        # In-process LRU of validation results keyed by token digest: (expires_at, payload or None)
+        self._local_cache: "OrderedDict[bytes, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._local_cache_lock = threading.Lock()
+    
+    def _encode(self, payload: Dict[str, Any]) -> str:
+        """
+        Encodes and signs a token payload.
+        
+        Args:
+            payload: Token claims to encode
+            
+        Returns:
+            JWT token string
+        """
+        if self._hmac_template is None:
+            return jwt.encode(payload, _SECRET_KEY, algorithm=JWT_ALGORITHM)
+        
+        signing_input = _JWT_HEADER_SEGMENT + b'.' + _b64url_encode(orjson.dumps(payload))
+        mac = self._hmac_template.copy()
+        mac.update(signing_input)
+        return (signing_input + b'.' + _b64url_encode(mac.digest())).decode('ascii')
     
     def create_token(self, user_data: Dict[str, Any], site_ids: List[int]) -> str:
         """
@@ -44,11 +143,11 @@ class JWTService:
         Returns:
             JWT token string
         """
-        # Get current time
-        current_time = get_utc_now()
+        # Get current epoch time
+        current_time = time.time()
         
         # Calculate expiration time
-        expiration_time = add_time_delta(current_time, minutes=JWT_TOKEN_LIFETIME_MINUTES)
+        expiration_time = current_time + JWT_TOKEN_LIFETIME_MINUTES * 60
         
         # Prepare payload with user data, site access, and standard claims
         payload = {
@@ -56,18 +155,26 @@ class JWTService:
             'name': user_data.get('name', user_data.get('username')),  # User's name
             'email': user_data.get('email'),  # User's email
             'sites': site_ids,  # Site access claims
-            'iat': current_time.timestamp(),  # Issued At
-            'exp': expiration_time.timestamp()  # Expiration Time
+            'iat': current_time,  # Issued At
+            'exp': expiration_time  # Expiration Time
         }
         
+        # Pack site access into a bitmask claim when all IDs fit and the mask is shorter than
+        # the JSON array; sparse high IDs can make the mask the larger of the two
+        if site_ids and 0 <= min(site_ids) and max(site_ids) < SITES_MASK_MAX_BITS:
+            sites_mask = _encode_site_mask(site_ids)
+            if len(sites_mask) + 2 < len(orjson.dumps(site_ids)):
+                payload['sites_mask'] = sites_mask
+                del payload['sites']
+        
         # Encode token
-        token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+        token = self._encode(payload)
         
-        # Cache token payload for faster validation
-        cache_key = f"{TOKEN_PAYLOAD}:{token}"
-        self._cache_service.set(cache_key, payload, JWT_TOKEN_LIFETIME_MINUTES * 60)
+        # Cache token payload for faster validation without holding up issuance
+        cache_key = _token_cache_key(TOKEN_PAYLOAD, token)
+        self._cache_service.set_async(cache_key, payload, JWT_TOKEN_LIFETIME_MINUTES * 60)
         
-        logger.info(f"Created token for user {payload['sub']} with access to {len(site_ids)} sites")
+        logger.info("Created token for user %s with access to %d sites", payload['sub'], len(site_ids))
         
         return token
     
@@ -81,24 +188,24 @@ class JWTService:
         Returns:
             Refresh token string
         """
-        # Get current time
-        current_time = get_utc_now()
+        # Get current epoch time
+        current_time = time.time()
         
         # Calculate expiration time (longer than access token)
-        expiration_time = add_time_delta(current_time, days=JWT_REFRESH_LIFETIME_DAYS)
+        expiration_time = current_time + JWT_REFRESH_LIFETIME_DAYS * 86400
         
         # Prepare refresh token payload
         payload = {
             'sub': user_id,  # Subject: user ID
             'type': 'refresh',  # Token type
-            'iat': current_time.timestamp(),  # Issued At
-            'exp': expiration_time.timestamp()  # Expiration Time
+            'iat': current_time,  # Issued At
+            'exp': expiration_time  # Expiration Time
         }
         
         # Encode refresh token
-        refresh_token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+        refresh_token = self._encode(payload)
         
-        logger.info(f"Created refresh token for user {user_id}")
+        logger.info("Created refresh token for user %s", user_id)
         
         return refresh_token
     
@@ -106,54 +213,114 @@ class JWTService:
         """
         Validates a JWT token and returns the decoded payload if valid.
         
+        Results, including rejections, are kept briefly in an in-process LRU so repeated
+        validations of the same token skip the shared cache and signature verification.
+        Failures to complete validation, such as an unreachable Auth0, are not cached.
+        
+        Args:
+            token: JWT token to validate
+            
+        Returns:
+            Decoded token payload or None if invalid
+        """
+        # Reject malformed input before spending cache lookups or crypto on it
+        if not token or len(token) > MAX_TOKEN_LENGTH or token.count('.') != 2:
+            logger.warning("Token validation failed: Malformed token")
+            return None
+        
+        local_key = _local_token_key(token)
+        now = time.time()
+        
+        with self._local_cache_lock:
+            entry = self._local_cache.get(local_key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._local_cache.move_to_end(local_key)
+                    return entry[1]
+                del self._local_cache[local_key]
+        
+        try:
+            payload = self._validate_token_uncached(token)
+        except Exception as e:
+            logger.error("Error validating token: %s", e)
+            return None
+        
+        if payload:
+            expires_at = min(payload.get('exp', 0), now + LOCAL_TOKEN_CACHE_TTL)
+        else:
+            expires_at = now + LOCAL_TOKEN_NEGATIVE_TTL
+        
+        if expires_at > now:
+            self._store_local_result(local_key, expires_at, payload)
+        
+        return payload
+    
+    def _store_local_result(self, local_key: bytes, expires_at: float, payload: Optional[Dict[str, Any]]) -> None:
+        """
+        Stores a validation result in the in-process LRU, evicting the oldest entry when full.
+        
+        Args:
+            local_key: Digest of the token
+            expires_at: Epoch time after which the entry is ignored
+            payload: Validated token payload, or None for a rejected token
+        """
+        with self._local_cache_lock:
+            self._local_cache[local_key] = (expires_at, payload)
+            self._local_cache.move_to_end(local_key)
+            if len(self._local_cache) > LOCAL_TOKEN_CACHE_SIZE:
+                self._local_cache.popitem(last=False)
+    
+    def _validate_token_uncached(self, token: str) -> Optional[Dict[str, Any]]:
+        """
+        Validates a JWT token against the shared cache, the local signing key, and Auth0.
+        
         Args:
             token: JWT token to validate
             
         Returns:
             Decoded token payload or None if invalid
+            
+        Raises:
+            Exception: If the token could not be verified either way, e.g. Auth0 is unreachable
         """
+        # Fetch blacklist status and cached payload in one round trip
+        blacklist_key = _token_cache_key(TOKEN_BLACKLIST, token)
+        cache_key = _token_cache_key(TOKEN_PAYLOAD, token)
+        blacklisted, cached_payload = self._cache_service.mget([blacklist_key, cache_key], ['str', 'json'])
+        
         # Check if token is blacklisted
-        blacklist_key = f"{TOKEN_BLACKLIST}:{token}"
-        if self._cache_service.get(blacklist_key):
+        if blacklisted:
             logger.warning("Token validation failed: Token is blacklisted")
             return None
         
         # Check if token payload is cached
-        cache_key = f"{TOKEN_PAYLOAD}:{token}"
-        cached_payload = self._cache_service.get(cache_key)
         if cached_payload:
             logger.debug("Token validation succeeded using cached payload")
             return cached_payload
         
         try:
-            # Try to decode and validate token using JWT library
+            # For locally issued tokens
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=_DECODE_ALGORITHMS)
+        except jwt.InvalidTokenError:
+            # If not a local token, try validating with Auth0
             try:
-                # For locally issued tokens
-                payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-                
-                # Cache validated payload
-                ttl = int(payload.get('exp', 0) - get_utc_now().timestamp())
-                if ttl > 0:
-                    self._cache_service.set(cache_key, payload, ttl)
-                    
-                return payload
-            except jwt.InvalidTokenError:
-                # If not a local token, try validating with Auth0
                 payload = self._auth0_client.validate_token(token)
-                
-                if payload:
-                    # Cache validated token payload
-                    ttl = int(payload.get('exp', 0) - get_utc_now().timestamp())
-                    if ttl > 0:
-                        self._cache_service.set(cache_key, payload, ttl)
-                    
-                    return payload
-                
-                # If Auth0 validation fails, propagate the failure
+            except AuthenticationError as e:
+                # Only a verdict on the token itself is a rejection; anything else propagates
+                if e.error_code != INVALID_TOKEN_ERROR_CODE:
+                    raise
+                logger.warning("Token validation failed: %s", e)
                 return None
-        except Exception as e:
-            logger.error(f"Error validating token: {str(e)}")
-            return None
+            
+            if not payload:
+                return None
+        
+        # Cache validated payload
+        ttl = int(payload.get('exp', 0) - time.time())
+        if ttl > 0:
+            self._cache_service.set(cache_key, payload, ttl)
+        
+        return payload
     
     def blacklist_token(self, token: str) -> bool:
         """
@@ -166,27 +333,31 @@ class JWTService:
             True if successful, False otherwise
         """
         try:
-            # Decode token without verification to extract jti (JWT ID) and exp (expiration)
-            payload = jwt.decode(token, options={"verify_signature": False})
+            # Decode token without verification to extract exp (expiration)
+            payload = _decode_unverified(token)
             
             # Calculate time until expiration
             exp_time = payload.get('exp', 0)
-            current_time = get_utc_now().timestamp()
+            current_time = time.time()
             ttl = max(0, int(exp_time - current_time))
             
             # Add token to blacklist with expiration
-            blacklist_key = f"{TOKEN_BLACKLIST}:{token}"
+            blacklist_key = _token_cache_key(TOKEN_BLACKLIST, token)
             self._cache_service.set(blacklist_key, True, ttl)
             
             # Delete any cached payload for this token
-            cache_key = f"{TOKEN_PAYLOAD}:{token}"
+            cache_key = _token_cache_key(TOKEN_PAYLOAD, token)
             self._cache_service.delete(cache_key)
             
-            logger.info(f"Token blacklisted with TTL of {ttl} seconds")
+            # Pin a rejection in the local cache for the rest of the token's lifetime so this
+            # instance refuses it without consulting the shared blacklist
+            self._store_local_result(_local_token_key(token), exp_time, None)
+            
+            logger.info("Token blacklisted with TTL of %d seconds", ttl)
             return True
             
         except Exception as e:
-            logger.error(f"Error blacklisting token: {str(e)}")
+            logger.error("Error blacklisting token: %s", e)
             return False
     
     def refresh_token(self, refresh_token: str) -> Optional[Dict[str, Any]]:
@@ -224,7 +395,7 @@ class JWTService:
             }
             
         except Exception as e:
-            logger.error(f"Error refreshing token: {str(e)}")
+            logger.error("Error refreshing token: %s", e)
             return None
     
     def get_site_ids_from_token(self, token_payload: Dict[str, Any]) -> List[int]:
@@ -237,10 +408,31 @@ class JWTService:
         Returns:
             List of site IDs the user has access to
         """
+        sites_mask = token_payload.get('sites_mask')
+        if sites_mask:
+            return _site_mask_ids(_decode_site_mask(sites_mask))
+        
         sites = token_payload.get('sites', [])
         # Ensure all site IDs are integers
         return [int(site_id) for site_id in sites] if sites else []
     
+    def token_has_site(self, token_payload: Dict[str, Any], site_id: int) -> bool:
+        """
+        Checks whether a validated token payload grants access to a site.
+        
+        Args:
+            token_payload: Decoded token payload
+            site_id: ID of the site to check
+            
+        Returns:
+            True if the token grants access to the site, False otherwise
+        """
+        sites_mask = token_payload.get('sites_mask')
+        if sites_mask:
+            return site_id >= 0 and bool((_decode_site_mask(sites_mask) >> site_id) & 1)
+        
+        return site_id in self.get_site_ids_from_token(token_payload)
+    
     def get_user_id_from_token(self, token_payload: Dict[str, Any]) -> str:
         """
         Extracts the user ID from a validated token payload.
@@ -7,7 +7,9 @@ It implements the permission matrix that defines what actions each role can perf
 on different resource types.
 """
 
-from typing import Dict, List, Optional, Union, Any
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from flask import g, has_app_context  # flask 2.3.2
 
 from ..repositories.user_repository import UserRepository
 from ..utils.enums import UserRole
@@ -20,6 +22,42 @@ logger = StructuredLogger(__name__)
 # Default role for users without explicit site assignments
 DEFAULT_SITE_ROLE = UserRole.VIEWER.value
 
+# Permission matrix defining the permissions each role has on each resource type
+PERMISSION_MATRIX: Dict[str, Dict[str, tuple]] = {
+    'interaction': {
+        # Site admins can perform all operations on interactions
+        UserRole.SITE_ADMIN.value: ('create', 'read', 'update', 'delete'),
+        # Editors can create, read, and update interactions
+        UserRole.EDITOR.value: ('create', 'read', 'update'),
+        # Viewers can only read interactions
+        UserRole.VIEWER.value: ('read',)
+    },
+    'user': {
+        # Site admins can manage users for their site
+        UserRole.SITE_ADMIN.value: ('read', 'create', 'update', 'delete', 'manage_roles', 'manage_users'),
+        # Editors can read user information
+        UserRole.EDITOR.value: ('read',),
+        # Viewers can read limited user information
+        UserRole.VIEWER.value: ('read',)
+    }
+}
+
+# Allowed permissions per (resource_type, role), frozen for constant-time membership checks
+_ROLE_PERMISSIONS: Dict[Tuple[str, str], FrozenSet[str]] = {
+    (resource_type, role): frozenset(permissions)
+    for resource_type, role_permissions in PERMISSION_MATRIX.items()
+    for role, permissions in role_permissions.items()
+}
+_NO_PERMISSIONS: FrozenSet[str] = frozenset()
+
+# Role hierarchy (higher value = higher privilege) and the rank of the most privileged role
+_ROLE_RANK: Dict[str, int] = {
+    UserRole.SITE_ADMIN.value: 3,
+    UserRole.EDITOR.value: 2,
+    UserRole.VIEWER.value: 1
+}
+_TOP_ROLE_RANK = _ROLE_RANK[UserRole.SITE_ADMIN.value]
+
 
 class PermissionService:
     """
@@ -39,27 +77,31 @@ class PermissionService:
         """
         self._user_repository = user_repository
         
-        # Initialize permission matrix defining permissions for each role
-        self._permission_matrix: Dict[str, Dict[str, List[str]]] = {
-            'interaction': {
-                # Site admins can perform all operations on interactions
-                UserRole.SITE_ADMIN.value: ['create', 'read', 'update', 'delete'],
-                # Editors can create, read, and update interactions
-                UserRole.EDITOR.value: ['create', 'read', 'update'],
-                # Viewers can only read interactions
-                UserRole.VIEWER.value: ['read']
-            },
-            'user': {
-                # Site admins can manage users for their site
-                UserRole.SITE_ADMIN.value: ['read', 'create', 'update', 'delete', 'manage_roles', 'manage_users'],
-                # Editors can read user information
-                UserRole.EDITOR.value: ['read'],
-                # Viewers can read limited user information
-                UserRole.VIEWER.value: ['read']
-            }
-        }
-        
-        logger.info("PermissionService initialized with permission matrix")
+        logger.info("PermissionService initialized")
+    
+    def _get_site_role_map(self, user_id: int) -> Dict[int, str]:
+        """
+        Get a user's site roles as a {site_id: role} mapping.
+        
+        The mapping is built from a single repository call and memoized on the request
+        context, so repeated permission checks within a request are dict lookups.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Mapping of site IDs to the user's role for each site
+        """
+        role_maps = g.setdefault('site_role_maps', {}) if has_app_context() else None
+        if role_maps is not None and user_id in role_maps:
+            return role_maps[user_id]
+        
+        sites = self._user_repository.get_user_sites(user_id)
+        role_map = {site['id']: site['role'] for site in sites}
+        
+        if role_maps is not None:
+            role_maps[user_id] = role_map
+        return role_map
     
     def get_user_role_for_site(self, user_id: int, site_id: int) -> Optional[str]:
         """
@@ -72,18 +114,13 @@ class PermissionService:
         Returns:
             User's role for the site or None if no access
         """
-        # Get user's sites from repository
-        sites = self._user_repository.get_user_sites(user_id)
+        role = self._get_site_role_map(user_id).get(site_id)
         
-        # Find the site in the user's site list
-        for site in sites:
-            if site['id'] == site_id:
-                role = site['role']
-                logger.debug(f"User {user_id} has role '{role}' for site {site_id}")
-                return role
-        
-        logger.debug(f"User {user_id} has no access to site {site_id}")
-        return None
+        if role is None:
+            logger.debug("User %s has no access to site %s", user_id, site_id)
+        else:
+            logger.debug("User %s has role '%s' for site %s", user_id, role, site_id)
+        return role
     
     def get_highest_site_role(self, user_id: int) -> str:
         """
@@ -95,31 +132,25 @@ class PermissionService:
         Returns:
             Highest role the user has across sites
         """
-        # Get user's sites
-        sites = self._user_repository.get_user_sites(user_id)
+        # Get user's site roles
+        site_roles = self._get_site_role_map(user_id).values()
         
-        if not sites:
-            logger.debug(f"User {user_id} has no site access, returning default role")
+        if not site_roles:
+            logger.debug("User %s has no site access, returning default role", user_id)
             return DEFAULT_SITE_ROLE
         
-        # Define role hierarchy (higher value = higher privilege)
-        role_hierarchy = {
-            UserRole.SITE_ADMIN.value: 3,
-            UserRole.EDITOR.value: 2,
-            UserRole.VIEWER.value: 1
-        }
-        
-        # Find highest role based on hierarchy
+        # Find highest role based on hierarchy, stopping as soon as the top role is seen
         highest_role = DEFAULT_SITE_ROLE
         highest_value = 0
         
-        for site in sites:
-            role = site['role']
-            if role in role_hierarchy and role_hierarchy[role] > highest_value:
-                highest_role = role
-                highest_value = role_hierarchy[role]
+        for role in site_roles:
+            value = _ROLE_RANK.get(role, 0)
+            if value > highest_value:
+                highest_role, highest_value = role, value
+                if value == _TOP_ROLE_RANK:
+                    break
         
-        logger.debug(f"User {user_id} has highest role '{highest_role}' across all sites")
+        logger.debug("User %s has highest role '%s' across all sites", user_id, highest_role)
         return highest_role
     
     def has_permission(self, user_id: int, site_id: int, resource_type: str, permission: str) -> bool:
@@ -140,29 +171,60 @@ class PermissionService:
         
         # If user has no access to the site, deny permission
         if role is None:
-            logger.debug(f"User {user_id} has no access to site {site_id}, permission denied")
+            logger.debug("User %s has no access to site %s, permission denied", user_id, site_id)
             return False
         
-        # Check if the resource_type exists in the permission matrix
-        if resource_type not in self._permission_matrix:
-            logger.warning(f"Resource type '{resource_type}' not found in permission matrix")
-            return False
-        
-        # Check if the role exists in the permission matrix for the resource
-        if role not in self._permission_matrix[resource_type]:
-            logger.warning(f"Role '{role}' not found in permission matrix for '{resource_type}'")
-            return False
+        # Check the permission against the role's allowed permissions for the resource
+        has_permission = permission in _ROLE_PERMISSIONS.get((resource_type, role), _NO_PERMISSIONS)
         
-        # Check if the permission is in the list of allowed permissions for the role
-        has_permission = permission in self._permission_matrix[resource_type][role]
+        if not has_permission and resource_type not in PERMISSION_MATRIX:
+            logger.warning("Resource type '%s' not found in permission matrix", resource_type)
         
         logger.debug(
-            f"User {user_id} with role '{role}' {'' if has_permission else 'does not '}have '{permission}' "
-            f"permission for '{resource_type}' in site {site_id}"
+            "User %s with role '%s' %shave '%s' permission for '%s' in site %s",
+            user_id, role, '' if has_permission else 'does not ', permission, resource_type, site_id
         )
         
         return has_permission
     
+    def allowed_permissions(self, user_id: int, site_id: int, resource_type: str) -> FrozenSet[str]:
+        """
+        Get every permission a user has for a resource type in a site.
+        
+        Use this instead of repeated has_permission calls when several permissions are
+        needed at once, since the user's role is looked up only once.
+        
+        Args:
+            user_id: ID of the user
+            site_id: ID of the site
+            resource_type: Type of resource (e.g., 'interaction', 'user')
+            
+        Returns:
+            Set of permissions the user has, empty if the user has no access to the site
+        """
+        role = self.get_user_role_for_site(user_id, site_id)
+        if role is None:
+            return _NO_PERMISSIONS
+        
+        return _ROLE_PERMISSIONS.get((resource_type, role), _NO_PERMISSIONS)
+    
+    def has_permissions_bulk(self, user_id: int, site_id: int, resource_type: str,
+                             permissions: List[str]) -> Dict[str, bool]:
+        """
+        Check several permissions for a resource type with a single role lookup.
+        
+        Args:
+            user_id: ID of the user
+            site_id: ID of the site
+            resource_type: Type of resource (e.g., 'interaction', 'user')
+            permissions: Permissions to check
+            
+        Returns:
+            Mapping of each requested permission to whether the user has it
+        """
+        allowed = self.allowed_permissions(user_id, site_id, resource_type)
+        return {permission: permission in allowed for permission in permissions}
+    
     def require_permission(self, user_id: int, site_id: int, resource_type: str, 
                           permission: str, error_message: str = None) -> bool:
         """
@@ -188,8 +250,8 @@ class PermissionService:
                 error_message = f"You don't have permission to {permission} this {resource_type}"
             
             logger.warning(
-                f"Authorization error: User {user_id} tried to {permission} {resource_type} "
-                f"in site {site_id} without permission"
+                "Authorization error: User %s tried to %s %s in site %s without permission",
+                user_id, permission, resource_type, site_id
             )
             
             raise AuthorizationError(error_message, {
@@ -218,7 +280,7 @@ class PermissionService:
         # If role is not None, user has access
         has_access = role is not None
         
-        logger.debug(f"User {user_id} {'' if has_access else 'does not '}have access to site {site_id}")
+        logger.debug("User %s %shave access to site %s", user_id, '' if has_access else 'does not ', site_id)
         
         return has_access
     
@@ -240,16 +302,15 @@ class PermissionService:
         # Check site access
         if not self.can_access_site(user_id, site_id):
             # Get user's sites for context
-            sites = self._user_repository.get_user_sites(user_id)
-            user_site_ids = [site['id'] for site in sites]
+            user_site_ids = list(self._get_site_role_map(user_id))
             
             # Use default error message if none provided
             if error_message is None:
                 error_message = f"You don't have access to site {site_id}"
             
             logger.warning(
-                f"Site context error: User {user_id} tried to access site {site_id} "
-                f"but only has access to sites {user_site_ids}"
+                "Site context error: User %s tried to access site %s but only has access to sites %s",
+                user_id, site_id, user_site_ids
             )
             
             raise SiteContextError(
@@ -275,7 +336,7 @@ class PermissionService:
         has_permission = self.has_permission(user_id, site_id, 'user', 'manage_users')
         
         logger.debug(
-            f"User {user_id} {'' if has_permission else 'cannot '}manage users for site {site_id}"
+            "User %s %smanage users for site %s", user_id, '' if has_permission else 'cannot ', site_id
         )
         
         return has_permission
@@ -295,42 +356,59 @@ class PermissionService:
         has_permission = self.has_permission(user_id, site_id, 'interaction', 'create')
         
         logger.debug(
-            f"User {user_id} {'' if has_permission else 'cannot '}create interactions for site {site_id}"
+            "User %s %screate interactions for site %s", user_id, '' if has_permission else 'cannot ', site_id
         )
         
         return has_permission
     
-    def can_edit_interaction(self, user_id: int, site_id: int, interaction_data: dict) -> bool:
+    def _can_act_on_interaction(self, user_id: int, site_id: int, interaction_data: dict,
+                                permission: str, action: str) -> bool:
         """
-        Check if user can edit a specific interaction.
+        Check if user can perform an action on a specific interaction.
         
         Args:
             user_id: ID of the user
             site_id: ID of the site
-            interaction_data: Data of the interaction to edit
+            interaction_data: Data of the interaction to act on
+            permission: Permission required for the action (e.g., 'update', 'delete')
+            action: Verb describing the action for log messages (e.g., 'edit', 'delete')
             
         Returns:
-            True if user can edit the interaction, False otherwise
+            True if user can perform the action, False otherwise
         """
         # Check if interaction belongs to the specified site
         interaction_site_id = interaction_data.get('site_id')
-        if interaction_site_id != site_id:
+        if interaction_site_id is None or interaction_site_id != site_id:
             logger.warning(
-                f"Cross-site access attempt: User {user_id} from site {site_id} "
-                f"tried to edit interaction from site {interaction_site_id}"
+                "Cross-site access attempt: User %s from site %s tried to %s interaction from site %s",
+                user_id, site_id, action, interaction_site_id
             )
             return False
         
-        # Check if user has 'update' permission for 'interaction' resource
-        has_permission = self.has_permission(user_id, site_id, 'interaction', 'update')
+        # Check if user has the permission for 'interaction' resource
+        has_permission = self.has_permission(user_id, site_id, 'interaction', permission)
         
         logger.debug(
-            f"User {user_id} {'' if has_permission else 'cannot '}edit interaction "
-            f"{interaction_data.get('id')} in site {site_id}"
+            "User %s %s%s interaction %s in site %s",
+            user_id, '' if has_permission else 'cannot ', action, interaction_data.get('id'), site_id
         )
         
         return has_permission
     
+    def can_edit_interaction(self, user_id: int, site_id: int, interaction_data: dict) -> bool:
+        """
+        Check if user can edit a specific interaction.
+        
+        Args:
+            user_id: ID of the user
+            site_id: ID of the site
+            interaction_data: Data of the interaction to edit
+            
+        Returns:
+            True if user can edit the interaction, False otherwise
+        """
+        return self._can_act_on_interaction(user_id, site_id, interaction_data, 'update', 'edit')
+    
     def can_delete_interaction(self, user_id: int, site_id: int, interaction_data: dict) -> bool:
         """
         Check if user can delete a specific interaction.
@@ -343,24 +421,7 @@ class PermissionService:
         Returns:
             True if user can delete the interaction, False otherwise
         """
-        # Check if interaction belongs to the specified site
-        interaction_site_id = interaction_data.get('site_id')
-        if interaction_site_id != site_id:
-            logger.warning(
-                f"Cross-site access attempt: User {user_id} from site {site_id} "
-                f"tried to delete interaction from site {interaction_site_id}"
-            )
-            return False
-        
-        # Check if user has 'delete' permission for 'interaction' resource
-        has_permission = self.has_permission(user_id, site_id, 'interaction', 'delete')
-        
-        logger.debug(
-            f"User {user_id} {'' if has_permission else 'cannot '}delete interaction "
-            f"{interaction_data.get('id')} in site {site_id}"
-        )
-        
-        return has_permission
+        return self._can_act_on_interaction(user_id, site_id, interaction_data, 'delete', 'delete')
     
     def has_role(self, user_id: int, site_id: int, required_role: str) -> bool:
         """
@@ -379,15 +440,15 @@ class PermissionService:
         
         # If user has no access to the site, deny permission
         if user_role is None:
-            logger.debug(f"User {user_id} has no access to site {site_id}, role check failed")
+            logger.debug("User %s has no access to site %s, role check failed", user_id, site_id)
             return False
         
         # Use UserRole.has_permission to check role hierarchy
         has_required_role = UserRole.has_permission(user_role, required_role)
         
         logger.debug(
-            f"User {user_id} with role '{user_role}' {'' if has_required_role else 'does not '}"
-            f"meet required role '{required_role}' for site {site_id}"
+            "User %s with role '%s' %smeet required role '%s' for site %s",
+            user_id, user_role, '' if has_required_role else 'does not ', required_role, site_id
         )
         
         return has_required_role
\ No newline at end of file
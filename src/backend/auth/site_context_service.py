@@ -25,6 +25,8 @@ logger = StructuredLogger(__name__)
 
 class SiteContext:
     """Class representing the current site context information"""
+
+    __slots__ = ('site_id', 'site_name', 'is_default')
     
     def __init__(self, site_id: int, site_name: str, is_default: bool = False):
         """
@@ -38,7 +40,6 @@ class SiteContext:
         self.site_id = site_id
         self.site_name = site_name
         self.is_default = is_default
-        logger.debug(f"Created site context for site {site_name} (ID: {site_id}, default: {is_default})")
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -77,17 +78,10 @@ class SiteContextService:
         Returns:
             Current site context or None if not set
         """
-        if hasattr(g, 'site_id') and g.site_id:
-            site_context = SiteContext(
-                site_id=g.site_id,
-                site_name=g.site_name,
-                is_default=g.is_default if hasattr(g, 'is_default') else False
-            )
-            logger.debug(f"Retrieved site context for site {g.site_name} (ID: {g.site_id})")
-            return site_context
-        
-        logger.debug("No site context found in request")
-        return None
+        site_context = g.get('site_context')
+        if site_context is None:
+            logger.debug("No site context found in request")
+        return site_context
     
     def set_site_context(self, site_id: int) -> SiteContext:
         """
@@ -104,19 +98,24 @@ class SiteContextService:
         """
         # Verify user is authenticated
         self._user_context_service.require_authentication()
+        user_id = self._user_context_service.get_current_user_id()
         
-        # Verify user has access to the site
+        # Verify user has access to the site according to their token claims
         if not self._user_context_service.has_site_access(site_id):
-            user_id = self._user_context_service.get_current_user_id()
             error_msg = f"User {user_id} does not have access to site {site_id}"
             logger.warning(error_msg)
             raise SiteContextError(error_msg)
         
-        # Get site information
-        site = self._site_repository.find_by_id(site_id)
+        # Get site information, confirming the user's access in the same query
+        site = self._site_repository.find_by_id_for_user(user_id, site_id)
         if not site:
-            error_msg = f"Site with ID {site_id} not found"
-            logger.error(error_msg)
+            # Only on failure, tell a missing site apart from revoked access
+            if self._site_repository.get_by_id(site_id):
+                error_msg = f"User {user_id} does not have access to site {site_id}"
+                logger.warning(error_msg)
+            else:
+                error_msg = f"Site with ID {site_id} not found"
+                logger.error(error_msg)
             raise SiteContextError(error_msg)
         
         # Create site context
@@ -127,15 +126,10 @@ class SiteContextService:
         )
         
         # Store in Flask g object
-        g.site_id = site.id
-        g.site_name = site.name
-        g.is_default = False
+        g.site_context = site_context
         
         # Cache site context
-        user_id = self._user_context_service.get_current_user_id()
-        if user_id:
-            cache_key = get_site_context_key(user_id)
-            self._cache_service.set(cache_key, site_context.to_dict())
+        self._cache_service.set(get_site_context_key(user_id), site_context.to_dict())
         
         logger.info(f"Set site context to site {site.name} (ID: {site.id})")
         return site_context
@@ -154,8 +148,7 @@ class SiteContextService:
         self._user_context_service.require_authentication()
         
         # Get user's available sites
-        user_id = self._user_context_service.get_current_user_id()
-        site_ids = self._user_context_service.get_current_user_site_ids()
+        user_id, site_ids = self._user_context_service.get_current_user_and_sites()
         
         if not site_ids:
             logger.warning(f"User {user_id} has no site access")
@@ -180,13 +173,10 @@ class SiteContextService:
         )
         
         # Store in Flask g object
-        g.site_id = site.id
-        g.site_name = site.name
-        g.is_default = True
+        g.site_context = site_context
         
         # Cache site context
-        cache_key = get_site_context_key(user_id)
-        self._cache_service.set(cache_key, site_context.to_dict())
+        self._cache_service.set(get_site_context_key(user_id), site_context.to_dict())
         
         logger.info(f"Set default site context to site {site.name} (ID: {site.id})")
         return site_context
@@ -195,11 +185,10 @@ class SiteContextService:
         """
         Clear site context from Flask request context
         """
-        if hasattr(g, 'site_id'):
-            logger.info(f"Clearing site context for site {g.site_name} (ID: {g.site_id})")
-            for attr in ['site_id', 'site_name', 'is_default']:
-                if hasattr(g, attr):
-                    delattr(g, attr)
+        site_context = g.get('site_context')
+        if site_context is not None:
+            logger.info(f"Clearing site context for site {site_context.site_name} (ID: {site_context.site_id})")
+            g.site_context = None
     
     def get_current_site_id(self) -> Optional[int]:
         """
@@ -208,13 +197,8 @@ class SiteContextService:
         Returns:
             Current site ID or None if no site context
         """
-        context = self.get_current_site_context()
-        if context:
-            logger.debug(f"Retrieved current site ID: {context.site_id}")
-            return context.site_id
-        
-        logger.debug("No active site context")
-        return None
+        context = g.get('site_context')
+        return context.site_id if context is not None else None
     
     def get_current_site(self) -> Optional[Site]:
         """
@@ -230,7 +214,7 @@ class SiteContextService:
         
         site = self._site_repository.find_by_id(site_id)
         if site:
-            logger.debug(f"Retrieved current site: {site.name} (ID: {site_id})")
+            logger.debug("Retrieved current site: %s (ID: %s)", site.name, site_id)
         else:
             logger.warning(f"Site with ID {site_id} not found despite being in context")
         
@@ -255,7 +239,7 @@ class SiteContextService:
             logger.warning(error_msg)
             raise SiteContextError(error_msg)
         
-        logger.debug(f"Verified site access for site ID: {site_id}")
+        logger.debug("Verified site access for site ID: %s", site_id)
         return True
     
     def get_available_sites(self) -> List[Dict[str, Any]]:
@@ -271,7 +255,7 @@ class SiteContextService:
             return []
         
         sites = self._site_repository.get_sites_for_user(user_id)
-        logger.debug(f"Retrieved {len(sites)} available sites for user {user_id}")
+        logger.debug("Retrieved %d available sites for user %s", len(sites), user_id)
         return sites
     
     def requires_site_context(self, func):
@@ -286,11 +270,10 @@ class SiteContextService:
         """
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not self.get_current_site_context():
+            if g.get('site_context') is None:
                 logger.warning("Function requires site context but none is set")
                 raise SiteContextError("Site context required for this operation")
             
-            logger.debug("Site context verified for function call")
             return func(*args, **kwargs)
         
         return wrapper
@@ -308,11 +291,8 @@ class SiteContextService:
         Raises:
             SiteContextError: If user doesn't have access to the site
         """
-        # Clear existing site context
-        self.clear_site_context()
-        
-        # Set new site context
+        # Set new site context, overwriting the existing one in place
         new_context = self.set_site_context(site_id)
         
-        logger.info(f"Switched site context to site {new_context.site_name} (ID: {new_context.site_id})")
+        logger.debug("Switched site context to site %s (ID: %s)", new_context.site_name, new_context.site_id)
         return new_context
\ No newline at end of file
@@ -7,10 +7,16 @@ It supports both Auth0 tokens and locally issued tokens with site-based access c
 """
 
 import jwt  # PyJWT 2.6.0
-import uuid
-from typing import Dict, List, Optional, Any, Union
+import base64
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
+
+import orjson  # version 3.9.2
 
-from ..utils.datetime_util import get_utc_now
 from ..utils.constants import (
     JWT_ISSUER,
     JWT_AUDIENCE,
@@ -22,12 +28,65 @@ from ..utils.constants import (
 from .auth0 import Auth0Client
 from ..cache.cache_keys import get_token_key, get_token_blacklist_key, TOKEN_TTL
 from ..cache.cache_service import get_cache_service
+from ..config import AUTH0_CONFIG, JWT_SECRET_KEY
 from ..utils.error_util import AuthenticationError
+from ..utils.string_util import token_digest
 from ..logging.structured_logger import StructuredLogger
 
 # Initialize logger
 logger = StructuredLogger(__name__)
 
+# Maximum number of verified tokens whose (jti, exp) claims are remembered in-process
+VERIFIED_CLAIMS_CACHE_SIZE = 4096
+
+
+# Decoder and accepted algorithms for locally issued tokens, configured once and shared
+_LOCAL_TOKEN_DECODER = jwt.PyJWT(options={'require': ['exp', 'iat', 'jti', 'iss', 'aud']})
+_LOCAL_TOKEN_ALGORITHMS = ['HS256']
+
+# Per-process random prefix and counter for token IDs; re-seeded in forked workers so that
+# processes never share a sequence
+_token_id_prefix = os.urandom(8).hex()
+_token_id_counter = itertools.count()
+
+
+def _reseed_token_ids() -> None:
+    """Give a forked process its own token ID prefix and counter."""
+    global _token_id_prefix, _token_id_counter
+    _token_id_prefix = os.urandom(8).hex()
+    _token_id_counter = itertools.count()
+
+
+os.register_at_fork(after_in_child=_reseed_token_ids)
+
+
+def _new_token_id() -> str:
+    """
+    Generate a unique token ID (jti) without per-token random number generation.
+    
+    Returns:
+        Token ID made of the process prefix and the next counter value
+    """
+    return f"{_token_id_prefix}{next(_token_id_counter):x}"
+
+
+def _fast_claims(token: str) -> Dict[str, Any]:
+    """
+    Read the claims of a JWT without validating it, by decoding its payload segment directly.
+    
+    Args:
+        token: JWT token to read claims from
+        
+    Returns:
+        Token claims, or an empty dict if the token is malformed
+    """
+    try:
+        _, payload_segment, _ = token.split('.', 2)
+        claims = orjson.loads(base64.urlsafe_b64decode(payload_segment + '=' * (-len(payload_segment) % 4)))
+    except ValueError:
+        return {}
+    return claims if isinstance(claims, dict) else {}
+
 
 class TokenService:
     """
@@ -39,6 +98,12 @@ class TokenService:
     access control through token claims.
     """
     
+    # Claims shared by every locally issued token
+    _BASE_CLAIMS: Dict[str, Any] = {
+        'iss': JWT_ISSUER,      # Issuer
+        'aud': JWT_AUDIENCE     # Audience
+    }
+    
     def __init__(self, auth0_client: Auth0Client = None):
         """
         Initialize the token service with Auth0 client and cache service.
@@ -49,12 +114,20 @@ class TokenService:
         self._auth0_client = auth0_client
         self._cache_service = get_cache_service()
         
-        # Get JWT secret key from environment or configuration
-        # In a real application, this should be securely stored and accessed
-        self._secret_key = "your-secret-key"  # TODO: Get from secure config
+        # Get JWT secret key for locally issued tokens from configuration
+        self._secret_key = JWT_SECRET_KEY
+        
+        # Locally issued tokens are signed and verified with a shared secret (HS256);
+        # Auth0 tokens are verified by the Auth0 client against its RS256 JWKS
+        self._local_algorithm = _LOCAL_TOKEN_ALGORITHMS[0]
         
-        # Set JWT algorithm (RS256 for Auth0 compatibility)
-        self._algorithm = "RS256"
+        # Exact issuer values that identify Auth0-issued tokens
+        self._auth0_issuers = frozenset(issuer.strip() for issuer in AUTH0_CONFIG.get('issuers', []) if issuer.strip())
+        
+        # In-process LRU mapping token digests to the (jti, exp) claims of tokens whose
+        # signature has already been verified, so repeat validations skip decoding
+        self._verified_claims: "OrderedDict[bytes, Tuple[str, int]]" = OrderedDict()
+        self._verified_claims_lock = threading.Lock()
         
         logger.info("TokenService initialized")
     
@@ -70,20 +143,19 @@ class TokenService:
             Encoded JWT access token string
         """
         # Get current UTC time
-        current_time = int(get_utc_now().timestamp())
+        current_time = int(time.time())
         # Calculate expiration time
         expiry_time = current_time + JWT_ACCESS_TOKEN_EXPIRES
         # Generate unique token ID
-        token_id = str(uuid.uuid4())
+        token_id = _new_token_id()
         
         # Create token payload with standard JWT claims
         payload = {
-            'iss': JWT_ISSUER,                  # Issuer
+            **self._BASE_CLAIMS,
             'sub': str(user_data.get('id')),    # Subject (user ID)
             'exp': expiry_time,                 # Expiration time
             'iat': current_time,                # Issued at time
             'jti': token_id,                    # JWT ID
-            'aud': JWT_AUDIENCE,                # Audience
             
             # User information
             'user_id': user_data.get('id'),
@@ -95,7 +167,7 @@ class TokenService:
         }
         
         # Encode token
-        token = jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        token = jwt.encode(payload, self._secret_key, algorithm=self._local_algorithm)
         
         # Store token in cache for faster validation
         cache_key = get_token_key(token_id)
@@ -117,25 +189,24 @@ class TokenService:
             Encoded JWT refresh token string
         """
         # Get current UTC time
-        current_time = int(get_utc_now().timestamp())
+        current_time = int(time.time())
         # Calculate expiration time
         expiry_time = current_time + JWT_REFRESH_TOKEN_EXPIRES
         # Generate unique token ID
-        token_id = str(uuid.uuid4())
+        token_id = _new_token_id()
         
         # Create token payload for refresh token
         payload = {
-            'iss': JWT_ISSUER,          # Issuer
+            **self._BASE_CLAIMS,
             'sub': str(user_id),        # Subject (user ID)
             'exp': expiry_time,         # Expiration time
             'iat': current_time,        # Issued at time
             'jti': token_id,            # JWT ID
-            'aud': JWT_AUDIENCE,        # Audience
             'token_type': token_type    # Identify as refresh token
         }
         
         # Encode token
-        token = jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        token = jwt.encode(payload, self._secret_key, algorithm=self._local_algorithm)
         
         logger.info(f"Created refresh token for user {user_id}")
         
@@ -146,7 +217,9 @@ class TokenService:
         Validate a JWT token and return decoded payload if valid.
         
         This method handles both Auth0 tokens and locally-issued tokens.
-        It checks token validity, expiration, and blacklist status.
+        It checks token validity, expiration, and blacklist status. Tokens verified
+        earlier by this process are resolved to their jti without decoding and served
+        from the payload cache.
         
         Args:
             token: JWT token to validate
@@ -155,41 +228,55 @@ class TokenService:
             Decoded token payload if valid, None if invalid
         """
         try:
-            # Check if token is blacklisted
-            token_payload = self.extract_token_payload(token)
-            if not token_payload or 'jti' not in token_payload:
-                logger.warning("Invalid token format: missing jti claim")
-                return None
-                
-            token_id = token_payload.get('jti')
+            digest = token_digest(token)
+            verified_claims = self._get_verified_claims(digest)
+            
+            if verified_claims is None:
+                # Extract the token ID without validation to check the blacklist
+                token_payload = _fast_claims(token)
+                if not token_payload or 'jti' not in token_payload:
+                    logger.warning("Invalid token format: missing jti claim")
+                    return None
+                token_id = token_payload.get('jti')
+            else:
+                token_payload = None
+                token_id = verified_claims[0]
+            
             blacklist_key = get_token_blacklist_key(token_id)
+            token_key = get_token_key(token_id)
             
-            if self._cache_service.exists(blacklist_key):
+            # A previously verified token can be served from the payload cache, so fetch the
+            # blacklist entry and cached payload in one round trip; the jti of an unverified
+            # token is attacker-controlled, so those only check the blacklist
+            if verified_claims is not None:
+                blacklisted, cached_payload = self._cache_service.mget([blacklist_key, token_key], ['str', 'json'])
+            else:
+                blacklisted, cached_payload = self._cache_service.exists(blacklist_key), None
+            
+            # Check if token is blacklisted
+            if blacklisted:
                 logger.warning(f"Token {token_id[:8]}... is blacklisted")
                 return None
             
-            # Check if token payload is already in cache
-            token_key = get_token_key(token_id)
-            cached_payload = self._cache_service.get(token_key, data_type='json')
-            
-            if cached_payload:
-                logger.debug(f"Using cached validation for token {token_id[:8]}...")
-                return cached_payload
+            if verified_claims is not None:
+                if cached_payload:
+                    logger.debug(f"Using cached validation for token {token_id[:8]}...")
+                    return cached_payload
+                
+                token_payload = _fast_claims(token)
             
             # Determine if token is Auth0 token
-            is_auth0_token = False
-            if token_payload.get('iss') and 'auth0.com' in token_payload.get('iss', ''):
-                is_auth0_token = True
+            is_auth0_token = token_payload.get('iss') in self._auth0_issuers
             
             if is_auth0_token and self._auth0_client:
                 # Validate using Auth0 client
                 payload = self._auth0_client.validate_token(token)
             else:
                 # Validate locally issued token
-                payload = jwt.decode(
+                payload = _LOCAL_TOKEN_DECODER.decode(
                     token,
                     self._secret_key,
-                    algorithms=[self._algorithm],
+                    algorithms=_LOCAL_TOKEN_ALGORITHMS,
                     audience=JWT_AUDIENCE,
                     issuer=JWT_ISSUER
                 )
@@ -197,10 +284,12 @@ class TokenService:
             # Cache successfully validated token
             if payload and 'jti' in payload:
                 exp_time = payload.get('exp', 0)
-                iat_time = payload.get('iat', 0)
-                ttl = exp_time - iat_time if exp_time and iat_time else TOKEN_TTL
+                # Cache for the token's remaining lifetime, falling back when it carries no expiry
+                ttl = exp_time - int(time.time())
+                ttl = TOKEN_TTL if ttl <= 0 else ttl
                 
-                self._cache_service.set(token_key, payload, ttl)
+                self._cache_service.set_async(token_key, payload, ttl)
+                self._remember_verified_claims(digest, payload['jti'], exp_time)
                 logger.debug(f"Cached validated token {token_id[:8]}...")
             
             logger.info(f"Token validation successful for user {payload.get('sub')}")
@@ -218,6 +307,50 @@ class TokenService:
             logger.error(f"Unexpected error during token validation: {str(e)}")
             return None
     
+    def _get_verified_claims(self, token_digest: bytes) -> Optional[Tuple[str, int]]:
+        """
+        Get the (jti, exp) claims of a previously verified token from the in-process cache.
+        
+        Entries whose token has expired are evicted instead of returned.
+        
+        Args:
+            token_digest: Digest of the token
+            
+        Returns:
+            Tuple of token ID and expiration timestamp, or None if absent or expired
+        """
+        with self._verified_claims_lock:
+            claims = self._verified_claims.get(token_digest)
+            if claims is None:
+                return None
+            
+            if claims[1] <= time.time():
+                del self._verified_claims[token_digest]
+                return None
+            
+            self._verified_claims.move_to_end(token_digest)
+            return claims
+    
+    def _remember_verified_claims(self, token_digest: bytes, token_id: str, exp_time: int) -> None:
+        """
+        Store the (jti, exp) claims of a verified token in the in-process cache.
+        
+        The least recently used entry is evicted once the cache is full.
+        
+        Args:
+            token_digest: Digest of the token
+            token_id: Verified jti claim of the token
+            exp_time: Verified exp claim of the token
+        """
+        if not exp_time:
+            return
+        
+        with self._verified_claims_lock:
+            self._verified_claims[token_digest] = (token_id, exp_time)
+            self._verified_claims.move_to_end(token_digest)
+            if len(self._verified_claims) > VERIFIED_CLAIMS_CACHE_SIZE:
+                self._verified_claims.popitem(last=False)
+    
     def blacklist_token(self, token: str) -> bool:
         """
         Add a token to the blacklist to prevent reuse after logout.
@@ -230,25 +363,24 @@ class TokenService:
         """
         try:
             # Extract token ID and expiry from token without validation
-            payload = self.extract_token_payload(token)
+            payload = _fast_claims(token)
             if not payload or 'jti' not in payload:
                 logger.warning("Cannot blacklist token: invalid format or missing jti claim")
                 return False
             
             token_id = payload.get('jti')
             expiry = payload.get('exp', 0)
-            current_time = int(get_utc_now().timestamp())
+            current_time = int(time.time())
             
             # Calculate time until expiry for TTL
-            ttl = max(expiry - current_time, 0) if expiry > current_time else TOKEN_BLACKLIST_TTL
+            ttl = expiry - current_time
+            ttl = TOKEN_BLACKLIST_TTL if ttl <= 0 else ttl
             
-            # Add token to blacklist
-            blacklist_key = get_token_blacklist_key(token_id)
-            self._cache_service.set(blacklist_key, "blacklisted", ttl)
-            
-            # Remove any cached token payload to prevent reuse
-            token_key = get_token_key(token_id)
-            self._cache_service.delete(token_key)
+            # Add token to blacklist and remove any cached payload in one round trip
+            self._cache_service.set_and_delete(
+                {get_token_blacklist_key(token_id): ("blacklisted", ttl)},
+                [get_token_key(token_id)]
+            )
             
             logger.info(f"Token {token_id[:8]}... blacklisted")
             return True
@@ -283,7 +415,7 @@ class TokenService:
             user_id = payload.get('sub')
             
             # For Auth0 tokens, use Auth0 client to refresh
-            if self._auth0_client and 'auth0.com' in payload.get('iss', ''):
+            if self._auth0_client and payload.get('iss') in self._auth0_issuers:
                 return self._auth0_client.refresh_token(refresh_token)
             
             # For local tokens, fetch user data and site access
@@ -6,23 +6,61 @@ request context, provides methods to retrieve user details, and enforces
 site-scoped access control by validating site access permissions.
 """
 
+import threading
+import time
+from collections import OrderedDict
 from flask import g
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from ..repositories.user_repository import UserRepository
 from ..models.user import User
 from .token_service import TokenService
 from ..utils.error_util import AuthenticationError
 from ..logging.structured_logger import StructuredLogger
-from ..cache.cache_keys import get_user_context_key
+from ..cache.cache_keys import get_user_context_key, USER_TTL
 from ..cache.cache_service import get_cache_service
+from ..cache.invalidation import register_user_invalidation_hook
 
 # Initialize logger
 logger = StructuredLogger(__name__)
 
+# Bounds for the in-process user context cache that sits in front of Redis.
+# A cached context skips the database lookup of the user, so changes made through
+# UserService or UserCacheInvalidator take effect at once in Redis and in this process.
+# Other workers keep their in-process copy for up to LOCAL_USER_CONTEXT_CACHE_TTL seconds.
+# Changes that bypass both, such as direct database edits, are only seen once the
+# Redis entry expires after USER_TTL.
+LOCAL_USER_CONTEXT_CACHE_SIZE = 2048
+LOCAL_USER_CONTEXT_CACHE_TTL = 30
+
+# Process-wide LRU of cached user contexts by cache key, as (monotonic expiry, to_wire payload),
+# shared by every service instance so an invalidation through any of them takes effect
+_local_contexts: "OrderedDict[str, Tuple[float, List[Any]]]" = OrderedDict()
+_local_contexts_lock = threading.Lock()
+
+# Attributes the user context occupies on Flask's g object
+_USER_CONTEXT_ATTRS = ('user_id', 'username', 'email', 'site_ids', 'site_id_set', 'user_context', 'current_user')
+
+
+def _drop_local_context(user_id: Any) -> None:
+    """
+    Drop a user's context from the in-process cache
+    
+    Args:
+        user_id: ID of the user whose cached context to drop
+    """
+    with _local_contexts_lock:
+        _local_contexts.pop(get_user_context_key(user_id), None)
+
+
+# Keep the in-process cache in step with invalidations made through the cache layer
+register_user_invalidation_hook(_drop_local_context)
+
 
 class UserContext:
     """Class representing the current user's context information"""
+
+    __slots__ = ('user_id', 'username', 'email', 'site_ids', 'is_authenticated', '_site_id_set')
     
     def __init__(self, user_id: int, username: str, email: str, site_ids: List[int] = None):
         """
@@ -38,8 +76,18 @@ class UserContext:
         self.username = username
         self.email = email
         self.site_ids = site_ids or []
+        self._site_id_set = frozenset(self.site_ids)
         self.is_authenticated = bool(user_id)
-        logger.debug(f"Created user context for user {username} (ID: {user_id})")
+        logger.debug("Created user context for user %s (ID: %s)", username, user_id)
+    
+    def __bool__(self) -> bool:
+        """
+        Treat the user context as truthy only when it represents an authenticated user
+        
+        Returns:
+            True if the user is authenticated, False otherwise
+        """
+        return self.is_authenticated
     
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -56,6 +104,29 @@ class UserContext:
             'is_authenticated': self.is_authenticated
         }
     
+    def to_wire(self) -> List[Any]:
+        """
+        Convert the user context to a compact positional payload for caching
+        
+        Returns:
+            List of user ID, username, email, site IDs and authentication flag
+        """
+        return [self.user_id, self.username, self.email, list(self.site_ids), self.is_authenticated]
+    
+    @classmethod
+    def from_wire(cls, wire: List[Any], site_ids: Optional[List[int]] = None) -> 'UserContext':
+        """
+        Rebuild a user context from a payload produced by to_wire
+        
+        Args:
+            wire: Positional payload from to_wire
+            site_ids: Site IDs to use instead of the cached ones, if given
+            
+        Returns:
+            Reconstructed user context
+        """
+        return cls(wire[0], wire[1], wire[2], wire[3] if site_ids is None else site_ids)
+    
     def has_site_access(self, site_id: int) -> bool:
         """
         Check if the user has access to a specific site
@@ -66,11 +137,32 @@ class UserContext:
         Returns:
             True if user has access to the site, False otherwise
         """
-        return site_id in self.site_ids
+        return site_id in self._site_id_set
+
+
+def _store_user_context(user_context: UserContext, user: Optional[User] = None) -> None:
+    """
+    Store a user context and its fields on Flask's g object in a single update
+    
+    Args:
+        user_context: User context to store
+        user: User model the context was built from, if already loaded
+    """
+    vars(g).update(
+        user_id=user_context.user_id,
+        username=user_context.username,
+        email=user_context.email,
+        site_ids=user_context.site_ids,
+        site_id_set=user_context._site_id_set,
+        user_context=user_context,
+        current_user=user
+    )
 
 
 class UserContextService:
     """Service responsible for managing user context throughout the application"""
+
+    __slots__ = ('_user_repository', '_token_service', '_cache_service')
     
     def __init__(self, user_repository: UserRepository, token_service: TokenService):
         """
@@ -92,6 +184,11 @@ class UserContextService:
         Returns:
             Current user context or None if not authenticated
         """
+        # Reuse the context already built for this request
+        user_context = g.get('user_context')
+        if user_context is not None:
+            return user_context
+        
         if hasattr(g, 'user_id') and g.user_id:
             user_context = UserContext(
                 user_id=g.user_id,
@@ -99,7 +196,8 @@ class UserContextService:
                 email=g.email,
                 site_ids=g.site_ids if hasattr(g, 'site_ids') else []
             )
-            logger.debug(f"Retrieved user context for user {g.username} (ID: {g.user_id})")
+            g.user_context = user_context
+            logger.debug("Retrieved user context for user %s (ID: %s)", g.username, g.user_id)
             return user_context
         
         logger.debug("No user context found in request")
@@ -125,36 +223,102 @@ class UserContextService:
             logger.warning("Token payload does not contain user ID")
             raise AuthenticationError("Invalid token - missing user ID")
         
-        # Get user from database
-        user = self._user_repository.find_by_id(user_id)
-        if not user:
-            logger.warning(f"User with ID {user_id} not found in database")
-            raise AuthenticationError(f"User with ID {user_id} not found")
-        
         # Extract site IDs from token
         site_ids = self._token_service.get_site_ids_from_token(token_payload)
         
-        # Create user context
-        user_context = UserContext(
-            user_id=user.id,
-            username=user.username,
-            email=user.email,
-            site_ids=site_ids
-        )
+        # Get user details from the context cache, falling back to the database
+        cache_key = get_user_context_key(user_id)
+        cached_context = self._get_cached_context(cache_key)
+        user = None
+        if cached_context is not None:
+            user_context = UserContext.from_wire(cached_context, site_ids)
+        else:
+            user = self._user_repository.find_by_id(user_id)
+            if not user:
+                logger.warning(f"User with ID {user_id} not found in database")
+                raise AuthenticationError(f"User with ID {user_id} not found")
+            
+            user_context = UserContext(
+                user_id=user.id,
+                username=user.username,
+                email=user.email,
+                site_ids=site_ids
+            )
+            
+            # Cache user context
+            self._cache_context(cache_key, user_context.to_wire())
         
         # Store in Flask g object
-        g.user_id = user.id
-        g.username = user.username
-        g.email = user.email
-        g.site_ids = site_ids
-        
-        # Cache user context
-        cache_key = get_user_context_key(user_id)
-        self._cache_service.set(cache_key, user_context.to_dict())
+        _store_user_context(user_context, user)
         
-        logger.info(f"Set user context for user {user.username} (ID: {user.id}) with access to {len(site_ids)} sites")
+        logger.info(f"Set user context for user {user_context.username} (ID: {user_context.user_id}) with access to {len(site_ids)} sites")
         return user_context
     
+    def _get_cached_context(self, cache_key: str) -> Optional[List[Any]]:
+        """
+        Get a cached user context from the in-process cache, falling back to Redis
+        
+        Args:
+            cache_key: User context cache key
+            
+        Returns:
+            Cached user context payload from UserContext.to_wire or None if not cached
+        """
+        with _local_contexts_lock:
+            entry = _local_contexts.get(cache_key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    _local_contexts.move_to_end(cache_key)
+                    return entry[1]
+                del _local_contexts[cache_key]
+        
+        # Entries in any other shape predate the positional payload and count as misses
+        context_data = self._cache_service.get(cache_key)
+        if not isinstance(context_data, list):
+            return None
+        self._store_local_context(cache_key, context_data)
+        return context_data
+    
+    def _cache_context(self, cache_key: str, context_data: List[Any]) -> None:
+        """
+        Cache a user context in-process and in Redis
+        
+        Args:
+            cache_key: User context cache key
+            context_data: User context payload from UserContext.to_wire
+        """
+        self._store_local_context(cache_key, context_data)
+        self._cache_service.set_async(cache_key, context_data, USER_TTL)
+    
+    def _store_local_context(self, cache_key: str, context_data: List[Any]) -> None:
+        """
+        Store a user context in the in-process cache, evicting the least recently used entry when full
+        
+        Args:
+            cache_key: User context cache key
+            context_data: User context payload from UserContext.to_wire
+        """
+        with _local_contexts_lock:
+            _local_contexts[cache_key] = (time.monotonic() + LOCAL_USER_CONTEXT_CACHE_TTL, context_data)
+            _local_contexts.move_to_end(cache_key)
+            if len(_local_contexts) > LOCAL_USER_CONTEXT_CACHE_SIZE:
+                _local_contexts.popitem(last=False)
+    
+    def invalidate_user_context(self, user_id: int) -> None:
+        """
+        Drop a user's cached context in-process and in Redis
+        
+        Call whenever the user is deleted, deactivated or has their details changed, so
+        the next authentication reloads the user from the database.
+        
+        Args:
+            user_id: ID of the user whose cached context to drop
+        """
+        # Drop the Redis entry first so the local one cannot be refilled from it
+        self._cache_service.delete(get_user_context_key(user_id))
+        _drop_local_context(user_id)
+        logger.debug("Invalidated cached user context for user %s", user_id)
+    
     def set_user_context(self, user: User) -> UserContext:
         """
         Set user context directly with user information
@@ -177,10 +341,7 @@ class UserContextService:
         )
         
         # Store in Flask g object
-        g.user_id = user.id
-        g.username = user.username
-        g.email = user.email
-        g.site_ids = site_ids
+        _store_user_context(user_context, user)
         
         logger.info(f"Set user context for user {user.username} (ID: {user.id}) with access to {len(site_ids)} sites")
         return user_context
@@ -191,11 +352,11 @@ class UserContextService:
         
         This removes all user-related attributes from the request context
         """
-        if hasattr(g, 'user_id'):
-            logger.info(f"Clearing user context for user {g.username} (ID: {g.user_id})")
-            for attr in ['user_id', 'username', 'email', 'site_ids']:
-                if hasattr(g, attr):
-                    delattr(g, attr)
+        request_globals = vars(g)
+        if 'user_id' in request_globals:
+            logger.info("Clearing user context for user %s (ID: %s)", request_globals.get('username'), request_globals['user_id'])
+            for attr in _USER_CONTEXT_ATTRS:
+                request_globals.pop(attr, None)
     
     def get_current_user_id(self) -> Optional[int]:
         """
@@ -204,13 +365,19 @@ class UserContextService:
         Returns:
             Current user ID or None if not authenticated
         """
-        context = self.get_current_user_context()
-        if context and context.is_authenticated:
-            logger.debug(f"Retrieved current user ID: {context.user_id}")
-            return context.user_id
+        return g.get('user_id') or None
+    
+    def get_current_user_and_sites(self) -> Tuple[Optional[int], List[int]]:
+        """
+        Get the current user's ID and accessible site IDs in one request context read
         
-        logger.debug("No authenticated user in current context")
-        return None
+        Returns:
+            Tuple of (user ID or None, list of site IDs the user has access to)
+        """
+        user_id = g.get('user_id')
+        if not user_id:
+            return None, []
+        return user_id, g.get('site_ids') or []
     
     def get_current_user(self) -> Optional[User]:
         """
@@ -219,6 +386,11 @@ class UserContextService:
         Returns:
             Current user model or None if not authenticated
         """
+        # Reuse the user model already loaded for this request
+        user = g.get('current_user')
+        if user is not None:
+            return user
+        
         user_id = self.get_current_user_id()
         if not user_id:
             logger.debug("Cannot get current user - no user ID in context")
@@ -226,7 +398,8 @@ class UserContextService:
         
         user = self._user_repository.find_by_id(user_id)
         if user:
-            logger.debug(f"Retrieved current user: {user.username} (ID: {user_id})")
+            g.current_user = user
+            logger.debug("Retrieved current user: %s (ID: %s)", user.username, user_id)
         else:
             logger.warning(f"User with ID {user_id} not found despite being in context")
         
@@ -239,13 +412,7 @@ class UserContextService:
         Returns:
             List of site IDs the user has access to
         """
-        context = self.get_current_user_context()
-        if context and context.is_authenticated:
-            logger.debug(f"Retrieved site IDs for current user: {context.site_ids}")
-            return context.site_ids
-        
-        logger.debug("No authenticated user in current context - returning empty site list")
-        return []
+        return self.get_current_user_and_sites()[1]
     
     def has_site_access(self, site_id: int) -> bool:
         """
@@ -257,16 +424,9 @@ class UserContextService:
         Returns:
             True if user has access to the site, False otherwise
         """
-        context = self.get_current_user_context()
-        if not context or not context.is_authenticated:
-            logger.debug(f"Site access check failed - no authenticated user in context")
-            return False
-        
-        has_access = context.has_site_access(site_id)
-        log_message = f"User {context.username} (ID: {context.user_id}) {'has' if has_access else 'does not have'} access to site {site_id}"
-        logger.debug(log_message)
-        
-        return has_access
+        # Checked against the frozenset stored with the context, without resolving it
+        site_id_set = g.get('site_id_set')
+        return site_id_set is not None and site_id in site_id_set
     
     def is_authenticated(self) -> bool:
         """
@@ -275,11 +435,7 @@ class UserContextService:
         Returns:
             True if authenticated, False otherwise
         """
-        context = self.get_current_user_context()
-        is_auth = context is not None and context.is_authenticated
-        
-        logger.debug(f"Authentication check: {'authenticated' if is_auth else 'not authenticated'}")
-        return is_auth
+        return bool(g.get('user_id'))
     
     def require_authentication(self) -> bool:
         """
@@ -310,5 +466,5 @@ class UserContextService:
             logger.warning(f"Site access required but user {user_id} does not have access to site {site_id}")
             raise AuthenticationError(f"Access to site {site_id} required")
         
-        logger.debug(f"Site access requirement satisfied for site {site_id}")
+        logger.debug("Site access requirement satisfied for site %s", site_id)
         return True
\ No newline at end of file
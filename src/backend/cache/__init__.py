@@ -37,8 +37,26 @@ from .invalidation import (
     SiteCacheInvalidator,
     InteractionCacheInvalidator,
     SearchCacheInvalidator,
-    invalidate_keys_by_pattern
+    invalidate_keys_by_pattern,
+    register_user_invalidation_hook
 )
 
-# Initialize the global cache service instance
-cache_service = create_cache_service()
\ No newline at end of file
+# The global cache service instance is created on first access rather than at import.
+# Importing the cache_service submodule bound its name on this package, so drop that
+# binding to let the lookup fall through to __getattr__.
+del cache_service
+
+
+def __getattr__(name):
+    """
+    Resolve the global cache service instance lazily on first access.
+    
+    Args:
+        name: Attribute name being looked up on the package
+        
+    Returns:
+        Shared cache service instance for 'cache_service'
+    """
+    if name == 'cache_service':
+        return get_cache_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
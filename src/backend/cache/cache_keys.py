@@ -9,6 +9,8 @@ The module provides functions for generating standardized cache keys for differe
 entity types, as well as helper functions for generating invalidation patterns.
 """
 
+import sys
+from functools import lru_cache
 from typing import Union, List, Dict, Any
 
 from ..utils.constants import JWT_ACCESS_TOKEN_EXPIRES, JWT_REFRESH_TOKEN_EXPIRES
@@ -21,6 +23,27 @@ BLACKLIST_PREFIX = "blacklist"
 INTERACTION_PREFIX = "interaction"
 INTERACTION_LIST_PREFIX = "interaction:list"
 SEARCH_PREFIX = "search"
+LOCK_PREFIX = "lock"
+
+# Key templates, built once from the prefixes and filled with %-formatting on each call
+TOKEN_KEY_TMPL = TOKEN_PREFIX + ":%s"
+TOKEN_BLACKLIST_KEY_TMPL = BLACKLIST_PREFIX + ":%s"
+USER_KEY_TMPL = USER_PREFIX + ":%s"
+USER_SITES_KEY_TMPL = USER_PREFIX + ":%s:sites"
+USER_CONTEXT_KEY_TMPL = USER_PREFIX + ":%s:context"
+SITE_CONTEXT_KEY_TMPL = USER_PREFIX + ":%s:site_context"
+SITE_KEY_TMPL = SITE_PREFIX + ":%s"
+INTERACTION_KEY_TMPL = INTERACTION_PREFIX + ":%s"
+LOCK_KEY_TMPL = LOCK_PREFIX + ":%s"
+
+# Paginated keys use fixed-width, zero-padded numeric components so every key of a kind
+# has the same length and a site's keys share an exact prefix (site 1 never matches site 12)
+SITE_ID_KEY_FMT = "%010d"
+INTERACTION_LIST_KEY_TMPL = INTERACTION_LIST_PREFIX + ":" + SITE_ID_KEY_FMT + ":%06d:%04d"
+SEARCH_KEY_TMPL = SEARCH_PREFIX + ":" + SITE_ID_KEY_FMT + ":%s:%06d:%04d"
+
+# Suffix of the Redis SET that indexes the cache keys belonging to an entity
+REFS_SUFFIX = ":refs"
 
 # TTL values in seconds
 TOKEN_TTL = 60 * 30  # 30 minutes
@@ -30,7 +53,11 @@ INTERACTION_TTL = 60 * 10  # 10 minutes
 SEARCH_TTL = 60 * 2  # 2 minutes
 REFERENCE_TTL = 60 * 60  # 1 hour
 
+# Entries kept per memoized single-ID key helper; the keys they return are interned
+KEY_CACHE_SIZE = 4096
+
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_token_key(token_id: str) -> str:
     """
     Generates a cache key for authentication tokens.
@@ -41,9 +68,10 @@ def get_token_key(token_id: str) -> str:
     Returns:
         Formatted cache key for the token
     """
-    return f"{TOKEN_PREFIX}:{token_id}"
+    return sys.intern(TOKEN_KEY_TMPL % (token_id,))
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_token_blacklist_key(token_id: str) -> str:
     """
     Generates a cache key for blacklisted tokens.
@@ -54,9 +82,10 @@ def get_token_blacklist_key(token_id: str) -> str:
     Returns:
         Formatted cache key for the blacklisted token
     """
-    return f"{BLACKLIST_PREFIX}:{token_id}"
+    return sys.intern(TOKEN_BLACKLIST_KEY_TMPL % (token_id,))
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_user_key(user_id: int) -> str:
     """
     Generates a cache key for user data.
@@ -67,9 +96,10 @@ def get_user_key(user_id: int) -> str:
     Returns:
         Formatted cache key for the user
     """
-    return f"{USER_PREFIX}:{user_id}"
+    return sys.intern(USER_KEY_TMPL % (user_id,))
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_user_sites_key(user_id: int) -> str:
     """
     Generates a cache key for user's site access list.
@@ -80,9 +110,38 @@ def get_user_sites_key(user_id: int) -> str:
     Returns:
         Formatted cache key for user's site access
     """
-    return f"{USER_PREFIX}:{user_id}:sites"
+    return sys.intern(USER_SITES_KEY_TMPL % (user_id,))
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def get_user_context_key(user_id: int) -> str:
+    """
+    Generates a cache key for a user's authenticated context.
+    
+    Args:
+        user_id: Database ID of the user
+        
+    Returns:
+        Formatted cache key for the user context
+    """
+    return sys.intern(USER_CONTEXT_KEY_TMPL % (user_id,))
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def get_site_context_key(user_id: int) -> str:
+    """
+    Generates a cache key for a user's active site context.
+    
+    Args:
+        user_id: Database ID of the user
+        
+    Returns:
+        Formatted cache key for the user's site context
+    """
+    return sys.intern(SITE_CONTEXT_KEY_TMPL % (user_id,))
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_site_key(site_id: int) -> str:
     """
     Generates a cache key for site data.
@@ -93,9 +152,10 @@ def get_site_key(site_id: int) -> str:
     Returns:
         Formatted cache key for the site
     """
-    return f"{SITE_PREFIX}:{site_id}"
+    return sys.intern(SITE_KEY_TMPL % (site_id,))
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def get_interaction_key(interaction_id: int) -> str:
     """
     Generates a cache key for interaction data.
@@ -106,7 +166,7 @@ def get_interaction_key(interaction_id: int) -> str:
     Returns:
         Formatted cache key for the interaction
     """
-    return f"{INTERACTION_PREFIX}:{interaction_id}"
+    return sys.intern(INTERACTION_KEY_TMPL % (interaction_id,))
 
 
 def get_interaction_list_key(site_id: int, page: int, size: int) -> str:
@@ -121,7 +181,7 @@ def get_interaction_list_key(site_id: int, page: int, size: int) -> str:
     Returns:
         Formatted cache key for the interaction list
     """
-    return f"{INTERACTION_LIST_PREFIX}:{site_id}:{page}:{size}"
+    return INTERACTION_LIST_KEY_TMPL % (int(site_id), int(page), int(size))
 
 
 def get_search_results_key(site_id: int, query_hash: str, page: int, size: int) -> str:
@@ -130,14 +190,71 @@ def get_search_results_key(site_id: int, query_hash: str, page: int, size: int)
     
     Args:
         site_id: Database ID of the site
-        query_hash: Hash of the search query parameters
+        query_hash: Fixed-length hash of the search query parameters
         page: Page number for pagination
         size: Number of items per page
         
     Returns:
         Formatted cache key for the search results
     """
-    return f"{SEARCH_PREFIX}:{site_id}:{query_hash}:{page}:{size}"
+    return SEARCH_KEY_TMPL % (int(site_id), query_hash, int(page), int(size))
+
+
+def get_lock_key(key: str) -> str:
+    """
+    Generates the key of the lock guarding recomputation of a cache entry.
+    
+    Args:
+        key: Cache key being recomputed
+        
+    Returns:
+        Formatted cache key for the lock
+    """
+    return LOCK_KEY_TMPL % (key,)
+
+
+def get_refs_key(entity_key: str) -> str:
+    """
+    Generates the key of the Redis SET indexing the cache keys tied to an entity.
+    
+    Args:
+        entity_key: Cache key of the entity, e.g. from get_site_key
+        
+    Returns:
+        Formatted cache key for the entity's reference set
+    """
+    return entity_key + REFS_SUFFIX
+
+
+def get_user_cache_keys(user_id: int) -> List[str]:
+    """
+    Lists the fixed cache keys stored for a user.
+    
+    Args:
+        user_id: Database ID of the user
+        
+    Returns:
+        Cache keys holding the user's data, site access and contexts
+    """
+    return [
+        get_user_key(user_id),
+        get_user_sites_key(user_id),
+        get_user_context_key(user_id),
+        get_site_context_key(user_id),
+    ]
+
+
+def get_search_results_pattern(site_id: int) -> str:
+    """
+    Generates a pattern matching every cached search result for a site.
+    
+    Args:
+        site_id: Database ID of the site
+        
+    Returns:
+        Pattern string for Redis SCAN command
+    """
+    return get_key_pattern_for_invalidation(SEARCH_PREFIX, SITE_ID_KEY_FMT % (int(site_id),) + ":")
 
 
 def get_key_pattern_for_invalidation(prefix: str, id_or_pattern: Union[int, str]) -> str:
@@ -154,4 +271,36 @@ def get_key_pattern_for_invalidation(prefix: str, id_or_pattern: Union[int, str]
     Returns:
         Pattern string for Redis SCAN command
     """
-    return f"{prefix}:{id_or_pattern}*"
\ No newline at end of file
+    return f"{prefix}:{id_or_pattern}*"
+
+__all__ = [
+    "USER_PREFIX",
+    "SITE_PREFIX",
+    "TOKEN_PREFIX",
+    "BLACKLIST_PREFIX",
+    "INTERACTION_PREFIX",
+    "INTERACTION_LIST_PREFIX",
+    "SEARCH_PREFIX",
+    "LOCK_PREFIX",
+    "TOKEN_TTL",
+    "USER_TTL",
+    "SITE_TTL",
+    "INTERACTION_TTL",
+    "SEARCH_TTL",
+    "REFERENCE_TTL",
+    "get_token_key",
+    "get_token_blacklist_key",
+    "get_user_key",
+    "get_user_sites_key",
+    "get_user_context_key",
+    "get_site_context_key",
+    "get_site_key",
+    "get_interaction_key",
+    "get_interaction_list_key",
+    "get_search_results_key",
+    "get_lock_key",
+    "get_refs_key",
+    "get_user_cache_keys",
+    "get_search_results_pattern",
+    "get_key_pattern_for_invalidation"
+]
@@ -7,16 +7,19 @@ It implements a multi-tier caching strategy for authentication, site access,
 interactions, and search results to improve application performance.
 """
 
-import json
 import pickle
 import hashlib
-from typing import Any, Dict, List, Optional, Callable, Union, TypeVar, Generic
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Callable, Tuple, Union, TypeVar, Generic
+
+import orjson  # version 3.9.2
 
 from .redis_client import RedisClient, get_redis_client
 from .cache_keys import (
     TOKEN_TTL, USER_TTL, SITE_TTL, INTERACTION_TTL, SEARCH_TTL,
     get_token_key, get_user_key, get_user_sites_key, get_interaction_key,
-    get_interaction_list_key, get_search_results_key
+    get_interaction_list_key, get_search_results_key, get_site_key, get_refs_key, get_lock_key
 )
 from .invalidation import (
     UserCacheInvalidator, SiteCacheInvalidator,
@@ -30,6 +33,13 @@ logger = get_logger(__name__)
 # Singleton instance
 _cache_service_instance = None
 
+# Seconds a get_or_set recomputation lock is held before it expires
+RECOMPUTE_LOCK_TIMEOUT = 10
+
+# Backoff in seconds between re-reads while another worker recomputes a key;
+# once exhausted the waiting caller computes the value itself
+RECOMPUTE_WAIT_DELAYS = (0.02, 0.05, 0.1, 0.1, 0.2, 0.2, 0.4, 0.4, 0.5)
+
 
 class CacheService:
     """
@@ -53,6 +63,9 @@ class CacheService:
         self._interaction_invalidator = InteractionCacheInvalidator(self._redis_client)
         self._search_invalidator = SearchCacheInvalidator(self._redis_client)
         
+        # Single background writer for fire-and-forget cache writes, preserving submission order
+        self._write_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cache-write')
+        
         logger.info("Cache service initialized")
     
     def get(self, key: str, default: Any = None, data_type: str = 'json') -> Any:
@@ -74,6 +87,25 @@ class CacheService:
             logger.error(f"Error retrieving value for key {key}: {str(e)}")
             return default
     
+    def mget(self, keys: List[str], data_type: Union[str, List[str]] = 'json') -> List[Any]:
+        """
+        Retrieve several values from cache in a single round trip.
+        
+        Args:
+            keys: Cache keys to retrieve
+            data_type: Data type for deserialization ('json', 'str', 'int', 'float', 'bool', 'pickle'),
+                       either one for all keys or a list with one entry per key
+            
+        Returns:
+            List of cached values in key order, with None for keys not found
+        """
+        try:
+            logger.debug(f"Getting values for {len(keys)} keys")
+            return self._redis_client.mget(keys, data_type)
+        except Exception as e:
+            logger.error(f"Error retrieving values for keys {keys}: {str(e)}")
+            return [None] * len(keys)
+    
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Store a value in cache with TTL.
@@ -93,6 +125,41 @@ class CacheService:
             logger.error(f"Error setting value for key {key}: {str(e)}")
             return False
     
+    def set_async(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value in cache with TTL without waiting for the write to complete.
+        
+        Use for best-effort cache population on latency-sensitive paths; failures are
+        logged by set and otherwise ignored.
+        
+        Args:
+            key: Cache key to set
+            value: Value to store
+            ttl: Time-to-live in seconds (None for no expiration)
+        """
+        try:
+            self._write_executor.submit(self.set, key, value, ttl)
+        except RuntimeError as e:
+            logger.error(f"Error scheduling write for key {key}: {str(e)}")
+    
+    def set_and_delete(self, set_items: Dict[str, Tuple[Any, Optional[int]]], delete_keys: List[str]) -> bool:
+        """
+        Store and remove several values in cache atomically in a single round trip.
+        
+        Args:
+            set_items: Mapping of cache key to (value, ttl) pairs, with ttl None for no expiration
+            delete_keys: Cache keys to delete
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            logger.debug(f"Setting {len(set_items)} and deleting {len(delete_keys)} keys")
+            return self._redis_client.set_and_delete(set_items, delete_keys)
+        except Exception as e:
+            logger.error(f"Error setting and deleting keys: {str(e)}")
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Remove a value from cache.
@@ -130,6 +197,9 @@ class CacheService:
         """
         Get value from cache or compute and store if not present.
         
+        On a miss only the worker holding the key's recomputation lock runs the callback;
+        the others wait briefly for it to populate the key instead of stampeding the backend.
+        
         Args:
             key: Cache key to retrieve
             callback: Function to call to compute value if not in cache
@@ -140,17 +210,35 @@ class CacheService:
             Cached or computed value
         """
         try:
-            # Check if key exists in cache
-            if self.exists(key):
-                # Return cached value if found
-                return self.get(key, data_type=data_type)
-            
-            # Compute value if not in cache
-            value = callback()
-            
-            # Store computed value in cache
-            if value is not None:
-                self.set(key, value, ttl)
+            # Read the key once; None values are never stored, so None means a miss
+            cached_value = self._redis_client.get(key, data_type)
+            if cached_value is not None:
+                return cached_value
+            
+            lock = self._redis_client.lock(get_lock_key(key), RECOMPUTE_LOCK_TIMEOUT)
+            if lock is not None and not lock.acquire():
+                # Another worker is computing the value; wait for it to land in cache
+                for delay in RECOMPUTE_WAIT_DELAYS:
+                    time.sleep(delay)
+                    cached_value = self._redis_client.get(key, data_type)
+                    if cached_value is not None:
+                        return cached_value
+                    if not lock.locked():
+                        break
+                
+                logger.warning(f"Computing value for key {key} without the recompute lock")
+                lock = None
+            
+            try:
+                # Compute value if not in cache
+                value = callback()
+                
+                # Store computed value in cache
+                if value is not None:
+                    self.set(key, value, ttl)
+            finally:
+                if lock is not None:
+                    self._release_lock(lock)
             
             return value
         except Exception as e:
@@ -158,6 +246,18 @@ class CacheService:
             # Call the callback as fallback
             return callback()
     
+    def _release_lock(self, lock: Any) -> None:
+        """
+        Release a recomputation lock, tolerating one that has already expired.
+        
+        Args:
+            lock: Lock acquired from the Redis client
+        """
+        try:
+            lock.release()
+        except Exception as e:
+            logger.warning(f"Error releasing cache lock: {str(e)}")
+    
     def store_auth_token(self, user_id: str, token: str, ttl: Optional[int] = None) -> bool:
         """
         Store authentication token in cache.
@@ -339,6 +439,57 @@ class CacheService:
             logger.error(f"Error retrieving interaction {interaction_id}: {str(e)}")
             return None
     
+    def store_interactions(self, interactions: Dict[int, Dict[str, Any]], ttl: Optional[int] = None) -> bool:
+        """
+        Store several interactions in cache in a single round trip.
+        
+        Args:
+            interactions: Interaction data dictionaries by interaction identifier
+            ttl: Time-to-live in seconds (defaults to INTERACTION_TTL)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not interactions:
+            return True
+        
+        try:
+            # Use default TTL if not specified
+            if ttl is None:
+                ttl = INTERACTION_TTL
+            
+            # Store all interactions through one pipeline
+            logger.info(f"Storing {len(interactions)} interactions")
+            return self._redis_client.set_many(
+                {get_interaction_key(interaction_id): (interaction_data, ttl)
+                 for interaction_id, interaction_data in interactions.items()}
+            )
+        except Exception as e:
+            logger.error(f"Error storing {len(interactions)} interactions: {str(e)}")
+            return False
+    
+    def get_interactions(self, interaction_ids: List[int]) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Retrieve several interactions from cache in a single round trip.
+        
+        Args:
+            interaction_ids: Interaction identifiers
+            
+        Returns:
+            Interaction data by identifier, with None for interactions not found
+        """
+        if not interaction_ids:
+            return {}
+        
+        try:
+            # Fetch all interaction keys with one MGET
+            logger.debug(f"Getting {len(interaction_ids)} interactions")
+            values = self._redis_client.mget([get_interaction_key(interaction_id) for interaction_id in interaction_ids], 'json')
+            return dict(zip(interaction_ids, values))
+        except Exception as e:
+            logger.error(f"Error retrieving {len(interaction_ids)} interactions: {str(e)}")
+            return dict.fromkeys(interaction_ids)
+    
     def invalidate_interaction(self, interaction_id: int, site_id: int) -> int:
         """
         Invalidate interaction cache and related lists/search results.
@@ -380,9 +531,9 @@ class CacheService:
             if ttl is None:
                 ttl = INTERACTION_TTL
             
-            # Store list data in cache
+            # Store list data in cache, indexed under the site for invalidation
             logger.info(f"Storing interaction list for site: {site_id}, page: {page}, size: {size}")
-            return self.set(key, list_data, ttl)
+            return self._redis_client.set_with_ref(key, list_data, ttl, get_refs_key(get_site_key(site_id)))
         except Exception as e:
             logger.error(f"Error storing interaction list for site {site_id}: {str(e)}")
             return False
@@ -591,19 +742,20 @@ class CacheService:
             Hash string representing the query and filters
         """
         try:
-            # Create a normalized string representation of filters
+            # Create a normalized JSON representation of filters
             # Sort the keys to ensure deterministic ordering
-            filter_str = json.dumps(filters, sort_keys=True)
-            
-            # Combine query and filters
-            combined = f"{query}:{filter_str}"
-            
-            # Generate MD5 hash
-            return hashlib.md5(combined.encode('utf-8')).hexdigest()
+            filter_bytes = orjson.dumps(filters, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            
+            # Hash query and filters as "query:filters" without building the combined string;
+            # a 128-bit BLAKE2b hash is a cache key, not a security primitive
+            query_hash = hashlib.blake2b(query.encode('utf-8'), digest_size=16)
+            query_hash.update(b':')
+            query_hash.update(filter_bytes)
+            return query_hash.hexdigest()
         except Exception as e:
             logger.error(f"Error generating query hash: {str(e)}")
             # Return fallback hash based on query alone
-            return hashlib.md5(query.encode('utf-8')).hexdigest()
+            return hashlib.blake2b(query.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def get_cache_service() -> CacheService:
@@ -10,17 +10,21 @@ concrete implementations for users, sites, interactions, and search results.
 """
 
 import logging
-from typing import List, Set, Dict, Any, Optional, Union, Type
+from typing import Callable, List, Set, Dict, Any, Optional, Union, Type
 from abc import ABC, abstractmethod
 
 from ..logging.structured_logger import get_logger
 from .cache_keys import (
     get_key_pattern_for_invalidation,
+    get_refs_key,
+    get_search_results_pattern,
+    get_site_key,
+    get_user_cache_keys,
+    get_user_sites_key,
     USER_PREFIX,
     SITE_PREFIX,
     TOKEN_PREFIX,
     INTERACTION_PREFIX,
-    INTERACTION_LIST_PREFIX,
     SEARCH_PREFIX
 )
 from .redis_client import RedisClient
@@ -28,6 +32,20 @@ from .redis_client import RedisClient
 # Initialize logger
 logger = get_logger(__name__)
 
+# Callbacks run after a user's cache entries are invalidated, so in-process caches
+# layered over Redis (such as the user context cache) can drop their copies too
+_user_invalidation_hooks: List[Callable[[Union[str, int]], None]] = []
+
+
+def register_user_invalidation_hook(hook: Callable[[Union[str, int]], None]) -> None:
+    """
+    Registers a callback to run whenever a user's cache entries are invalidated.
+    
+    Args:
+        hook: Callable receiving the invalidated user ID
+    """
+    _user_invalidation_hooks.append(hook)
+
 
 def invalidate_keys_by_pattern(redis_client: RedisClient, pattern: str) -> int:
     """
@@ -72,6 +90,62 @@ def invalidate_keys_by_pattern(redis_client: RedisClient, pattern: str) -> int:
         return 0
 
 
+def invalidate_keys(redis_client: RedisClient, keys: List[str]) -> int:
+    """
+    Invalidates a known list of cache keys with a single DEL.
+    
+    Args:
+        redis_client: Redis client instance
+        keys: Concrete keys to delete
+        
+    Returns:
+        Number of invalidated keys
+    """
+    try:
+        redis_client.connect()
+        deleted_count = redis_client._redis_client.delete(*keys)
+        
+        logger.info(f"Invalidated {deleted_count} of {len(keys)} keys")
+        return deleted_count
+    except Exception as e:
+        logger.error(f"Error invalidating keys {keys}: {str(e)}")
+        return 0
+
+
+def invalidate_refs(redis_client: RedisClient, refs_key: str, keys: Optional[List[str]] = None) -> int:
+    """
+    Invalidates the cache keys indexed by an entity's reference set, plus any known keys.
+    
+    Deletes the indexed keys, the extra keys and the reference set itself with a single
+    DEL, avoiding a SCAN over the keyspace.
+    
+    Args:
+        redis_client: Redis client instance
+        refs_key: Key of the Redis SET indexing the entity's cache keys
+        keys: Additional concrete keys to delete
+        
+    Returns:
+        Number of invalidated keys, not counting the reference set
+    """
+    try:
+        redis_client.connect()
+        _redis = redis_client._redis_client
+        
+        indexed_keys = _redis.smembers(refs_key)
+        keys_to_delete = list(keys or [])
+        keys_to_delete.extend(indexed_keys)
+        keys_to_delete.append(refs_key)
+        
+        # The reference set only exists while it has members
+        deleted_count = _redis.delete(*keys_to_delete) - (1 if indexed_keys else 0)
+        
+        logger.info(f"Invalidated {deleted_count} keys referenced by {refs_key}")
+        return deleted_count
+    except Exception as e:
+        logger.error(f"Error invalidating keys referenced by {refs_key}: {str(e)}")
+        return 0
+
+
 class CacheInvalidator(ABC):
     """
     Abstract base class for cache invalidation strategies.
@@ -151,19 +225,17 @@ class UserCacheInvalidator(CacheInvalidator):
         """
         logger.info(f"Invalidating cache for user {user_id}")
         
-        # Generate pattern for user data keys
-        pattern = get_key_pattern_for_invalidation(self._prefix, user_id)
+        # Invalidate user data, site access and contexts, whose keys are all known
+        user_count = invalidate_keys(self._redis_client, get_user_cache_keys(user_id))
         
-        # Invalidate user data
-        user_count = self.invalidate_by_pattern(pattern)
-        
-        # Invalidate user site access
-        site_count = self.invalidate_site_access(user_id)
+        # Drop in-process copies only after Redis, so they cannot be refilled from stale entries
+        for hook in _user_invalidation_hooks:
+            hook(user_id)
         
         # Invalidate user tokens
         token_count = self.invalidate_token(user_id)
         
-        total_count = user_count + site_count + token_count
+        total_count = user_count + token_count
         logger.info(f"Invalidated {total_count} cache entries for user {user_id}")
         
         return total_count
@@ -193,8 +265,7 @@ class UserCacheInvalidator(CacheInvalidator):
         Returns:
             Number of invalidated cache entries
         """
-        pattern = get_key_pattern_for_invalidation(f"{USER_PREFIX}:{user_id}", "sites")
-        count = self.invalidate_by_pattern(pattern)
+        count = int(self._redis_client.delete(get_user_sites_key(user_id)))
         logger.info(f"Invalidated {count} site access cache entries for user {user_id}")
         return count
 
@@ -231,11 +302,8 @@ class SiteCacheInvalidator(CacheInvalidator):
         """
         logger.info(f"Invalidating cache for site {site_id}")
         
-        # Generate pattern for site keys
-        pattern = get_key_pattern_for_invalidation(self._prefix, site_id)
-        
-        # Invalidate site data
-        count = self.invalidate_by_pattern(pattern)
+        # Invalidate site data and the cache keys indexed under the site
+        count = invalidate_refs(self._redis_client, get_refs_key(get_site_key(site_id)), [get_site_key(site_id)])
         
         logger.info(f"Invalidated {count} cache entries for site {site_id}")
         return count
@@ -326,8 +394,7 @@ class InteractionCacheInvalidator(CacheInvalidator):
         Returns:
             Number of invalidated cache entries
         """
-        pattern = get_key_pattern_for_invalidation(INTERACTION_LIST_PREFIX, site_id)
-        count = self.invalidate_by_pattern(pattern)
+        count = invalidate_refs(self._redis_client, get_refs_key(get_site_key(site_id)))
         logger.info(f"Invalidated {count} interaction list cache entries for site {site_id}")
         return count
 
@@ -364,7 +431,7 @@ class SearchCacheInvalidator(CacheInvalidator):
         logger.info(f"Invalidating search cache for site {site_id}")
         
         # Generate pattern for search keys
-        pattern = get_key_pattern_for_invalidation(self._prefix, site_id)
+        pattern = get_search_results_pattern(site_id)
         
         # Invalidate search data
         count = self.invalidate_by_pattern(pattern)
@@ -8,9 +8,9 @@ like hashes and lists, with automatic serialization of Python objects.
 """
 
 import redis  # version 4.5.4
-import json  # standard library
+import orjson  # version 3.9.2
 import pickle  # standard library
-from typing import Any, Dict, List, Optional, Union  # standard library
+from typing import Any, Dict, List, Optional, Tuple, Union  # standard library
 from contextlib import contextmanager  # standard library
 
 from ..config import REDIS_CONFIG
@@ -42,7 +42,7 @@ def serialize_data(data: Any) -> bytes:
     try:
         if isinstance(data, (dict, list)):
             # Use JSON for dictionaries and lists for better interoperability
-            return json.dumps(data).encode('utf-8')
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
         else:
             # Use pickle for more complex Python objects
             return pickle.dumps(data)
@@ -69,7 +69,7 @@ def deserialize_data(data: bytes, data_type: str = 'str') -> Any:
     
     try:
         # Decode bytes to string if we're dealing with text-based data
-        if data_type in ('str', 'int', 'float', 'bool', 'json'):
+        if data_type in ('str', 'int', 'float', 'bool'):
             decoded = data.decode('utf-8')
         
         # Process according to expected type
@@ -82,7 +82,7 @@ def deserialize_data(data: bytes, data_type: str = 'str') -> Any:
         elif data_type == 'bool':
             return decoded.lower() in ('true', 't', 'yes', 'y', '1')
         elif data_type == 'json':
-            return json.loads(decoded)
+            return orjson.loads(data)
         elif data_type == 'pickle':
             return pickle.loads(data)
         else:
@@ -221,6 +221,37 @@ class RedisClient:
             logger.error(error_message)
             return None
     
+    def mget(self, keys: List[str], data_type: Union[str, List[str]] = 'str') -> List[Any]:
+        """
+        Retrieves several values from the cache in a single round trip.
+        
+        Args:
+            keys: Redis keys to retrieve
+            data_type: Expected data type for deserialization, either one for all keys
+                       or a list with one entry per key
+            
+        Returns:
+            List of cached values in key order, with None for missing keys
+        """
+        if not self._connected and not self.connect():
+            logger.warning("Cannot get keys, not connected to Redis")
+            return [None] * len(keys)
+        
+        try:
+            # Execute Redis MGET command for all keys
+            results = self._redis_client.mget(keys)
+            
+            # Deserialize each result, keeping None for missing keys
+            data_types = [data_type] * len(keys) if isinstance(data_type, str) else data_type
+            return [
+                None if result is None else deserialize_data(result, result_type)
+                for result, result_type in zip(results, data_types)
+            ]
+        except redis.RedisError as e:
+            error_message = f"Error retrieving {len(keys)} keys from Redis: {str(e)}"
+            logger.error(error_message)
+            return [None] * len(keys)
+    
     def set(self, key: str, value: Any, ttl: int = None) -> bool:
         """
         Sets a value in the cache with optional expiration.
@@ -254,6 +285,110 @@ class RedisClient:
             logger.error(error_message)
             return False
     
+    def set_many(self, items: Dict[str, Tuple[Any, Optional[int]]]) -> bool:
+        """
+        Sets several keys in a single round trip without a MULTI/EXEC transaction.
+        
+        Args:
+            items: Mapping of Redis key to (value, ttl) pairs, with ttl None for no expiration
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._connected and not self.connect():
+            logger.warning("Cannot set keys, not connected to Redis")
+            return False
+        
+        try:
+            # Queue all commands in a plain pipeline; each key stands alone, so no atomicity is needed
+            pipeline = self._redis_client.pipeline(transaction=False)
+            for key, (value, ttl) in items.items():
+                serialized_value = serialize_data(value)
+                if ttl is not None:
+                    pipeline.setex(key, ttl, serialized_value)
+                else:
+                    pipeline.set(key, serialized_value)
+            pipeline.execute()
+            
+            return True
+        except redis.RedisError as e:
+            error_message = f"Error setting {len(items)} keys in Redis: {str(e)}"
+            logger.error(error_message)
+            return False
+    
+    def set_and_delete(self, set_items: Dict[str, Tuple[Any, Optional[int]]], delete_keys: List[str]) -> bool:
+        """
+        Sets and deletes several keys atomically in a single round trip.
+        
+        Args:
+            set_items: Mapping of Redis key to (value, ttl) pairs, with ttl None for no expiration
+            delete_keys: Redis keys to delete
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._connected and not self.connect():
+            logger.warning("Cannot set and delete keys, not connected to Redis")
+            return False
+        
+        try:
+            # Queue all commands in a MULTI/EXEC pipeline and send them together
+            pipeline = self._redis_client.pipeline(transaction=True)
+            for key, (value, ttl) in set_items.items():
+                serialized_value = serialize_data(value)
+                if ttl is not None:
+                    pipeline.setex(key, ttl, serialized_value)
+                else:
+                    pipeline.set(key, serialized_value)
+            if delete_keys:
+                pipeline.delete(*delete_keys)
+            pipeline.execute()
+            
+            return True
+        except redis.RedisError as e:
+            error_message = f"Error setting {len(set_items)} and deleting {len(delete_keys)} keys in Redis: {str(e)}"
+            logger.error(error_message)
+            return False
+    
+    def set_with_ref(self, key: str, value: Any, ttl: int = None, refs_key: str = None) -> bool:
+        """
+        Sets a value and records its key in an entity's reference set in a single round trip.
+        
+        The reference set expires with the value, so it never outlives the keys it indexes
+        when they share a TTL.
+        
+        Args:
+            key: Redis key to set
+            value: Value to store (will be serialized)
+            ttl: Time-to-live in seconds (None for no expiration)
+            refs_key: Redis SET recording the keys tied to the entity
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self._connected and not self.connect():
+            logger.warning("Cannot set key, not connected to Redis")
+            return False
+        
+        try:
+            serialized_value = serialize_data(value)
+            
+            pipeline = self._redis_client.pipeline(transaction=True)
+            if ttl is not None:
+                pipeline.setex(key, ttl, serialized_value)
+            else:
+                pipeline.set(key, serialized_value)
+            pipeline.sadd(refs_key, key)
+            if ttl is not None:
+                pipeline.expire(refs_key, ttl)
+            pipeline.execute()
+            
+            return True
+        except redis.RedisError as e:
+            error_message = f"Error setting key '{key}' with reference in '{refs_key}': {str(e)}"
+            logger.error(error_message)
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Removes a key from the cache.
@@ -606,6 +741,26 @@ class RedisClient:
             logger.error(error_message)
             return 0
     
+    def lock(self, name: str, timeout: int) -> Optional[redis.lock.Lock]:
+        """
+        Creates a non-blocking distributed lock that expires after a timeout.
+        
+        The lock is released only by the holder that acquired it, so an expired
+        holder cannot release a lock since taken by another worker.
+        
+        Args:
+            name: Redis key of the lock
+            timeout: Seconds after which the lock expires if not released
+            
+        Returns:
+            Lock object to acquire and release, or None if not connected
+        """
+        if not self._connected and not self.connect():
+            logger.warning("Cannot create lock, not connected to Redis")
+            return None
+        
+        return self._redis_client.lock(name, timeout=timeout, blocking=False)
+    
     def health_check(self) -> bool:
         """
         Performs a health check on the Redis connection.
@@ -24,6 +24,7 @@ load_dotenv()
 ENV = os.getenv('FLASK_ENV', 'development')
 DEBUG = os.getenv('DEBUG', 'True') == 'True'
 SECRET_KEY = os.getenv('SECRET_KEY', 'dev_secret_key_change_in_production')
+JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY', SECRET_KEY)
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 
 
@@ -169,12 +170,17 @@ REDIS_CONFIG = {
 }
 
 # Auth0 configuration
+AUTH0_DOMAIN = get_env_var('AUTH0_DOMAIN', 'your-domain.auth0.com')
 AUTH0_CONFIG = {
-    'domain': get_env_var('AUTH0_DOMAIN', 'your-domain.auth0.com'),
+    'domain': AUTH0_DOMAIN,
     'api_audience': get_env_var('AUTH0_API_AUDIENCE', 'your-audience'),
     'client_id': get_env_var('AUTH0_CLIENT_ID', 'your-client-id'),
     'client_secret': get_env_var('AUTH0_CLIENT_SECRET', 'your-client-secret'),
     'algorithms': ['RS256'],
+    # Namespaced ID token claim carrying the user's Auth0 app_metadata (added by an Auth0 Action)
+    'app_metadata_claim': get_env_var('AUTH0_APP_METADATA_CLAIM', 'https://interaction-management/app_metadata'),
+    # Exact 'iss' values of Auth0-issued tokens (comma-separated; include any custom domains)
+    'issuers': get_env_var('AUTH0_ISSUERS', f'https://{AUTH0_DOMAIN}/').split(','),
 }
 
 # CORS configuration
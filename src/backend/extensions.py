@@ -17,6 +17,14 @@ db = SQLAlchemy()
 # JWT manager for authentication and authorization
 jwt = JWTManager()
 
+
+@jwt.user_lookup_loader
+def user_lookup_callback(_jwt_header, jwt_data):
+    """Resolve the current JWT identity from the token subject claim."""
+    identity = jwt_data["sub"]
+    return identity
+
+
 # CORS extension for handling cross-origin requests
 cors = CORS()
 
@@ -53,7 +53,7 @@ def on_starting(server):
     Args:
         server: Gunicorn server instance
     """
-    logger.info("Starting Gunicorn server", {
+    logger.info("Starting Gunicorn server", extra={
         "workers": workers,
         "bind": bind,
         "worker_class": worker_class,
@@ -69,7 +69,7 @@ def post_fork(server, worker):
         server: Gunicorn server instance
         worker: Worker instance that was forked
     """
-    logger.info("Worker spawned", {
+    logger.info("Worker spawned", extra={
         "pid": worker.pid,
         "worker_id": worker.id,
         "server_pid": server.pid
@@ -83,7 +83,7 @@ def on_exit(server, worker):
         server: Gunicorn server instance
         worker: Worker instance that is exiting
     """
-    logger.info("Worker exiting", {
+    logger.info("Worker exiting", extra={
         "pid": worker.pid,
         "worker_id": worker.id,
         "server_pid": server.pid
@@ -96,7 +96,7 @@ def worker_int(worker):
     Args:
         worker: Worker instance that received the signal
     """
-    logger.info("Worker received interrupt signal", {
+    logger.info("Worker received interrupt signal", extra={
         "pid": worker.pid,
         "worker_id": worker.id
     })
@@ -108,7 +108,7 @@ def worker_abort(worker):
     Args:
         worker: Worker instance that was aborted
     """
-    logger.error("Worker aborted", {
+    logger.error("Worker aborted", extra={
         "pid": worker.pid,
         "worker_id": worker.id,
         "reason": "Worker exceeded timeout or memory limit"
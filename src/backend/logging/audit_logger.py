@@ -80,9 +80,9 @@ class AuditLogger:
         
         # Log at appropriate level based on success
         if success:
-            self._logger.info(f"Authentication {action} succeeded for user {username}", audit_event)
+            self._logger.info(f"Authentication {action} succeeded for user {username}", extra=audit_event)
         else:
-            self._logger.warning(f"Authentication {action} failed for user {username}", audit_event)
+            self._logger.warning(f"Authentication {action} failed for user {username}", extra=audit_event)
     
     def log_authorization(self, action: str, resource_type: str, resource_id: str, 
                           success: bool, details: Dict = None) -> None:
@@ -127,12 +127,12 @@ class AuditLogger:
         if success:
             self._logger.info(
                 f"Authorization {action} granted for {resource_type} {resource_id}", 
-                audit_event
+                extra=audit_event
             )
         else:
             self._logger.warning(
                 f"Authorization {action} denied for {resource_type} {resource_id}", 
-                audit_event
+                extra=audit_event
             )
     
     def log_data_access(self, action: str, resource_type: str, resource_id: str, 
@@ -175,7 +175,7 @@ class AuditLogger:
         # Log data access events at info level
         self._logger.info(
             f"Data access {action} for {resource_type} {resource_id}", 
-            audit_event
+            extra=audit_event
         )
     
     def log_data_modification(self, action: str, resource_type: str, resource_id: str, 
@@ -227,7 +227,7 @@ class AuditLogger:
         # Log data modification events at info level
         self._logger.info(
             f"Data modification {action} for {resource_type} {resource_id}", 
-            audit_event
+            extra=audit_event
         )
     
     def log_interaction_history(self, interaction: object, change_type: str, 
@@ -187,8 +187,9 @@ def get_context_data() -> Dict[str, Any]:
             context['user_id'] = g.user_id
         
         # Add site information if available in g
-        if hasattr(g, 'site_id'):
-            context['site_id'] = g.site_id
+        site_context = g.get('site_context')
+        if site_context is not None:
+            context['site_id'] = site_context.site_id
         elif hasattr(g, 'site_ids') and g.site_ids:
             context['site_ids'] = g.site_ids
     
@@ -272,14 +273,19 @@ class StructuredLogger:
             except NameError:
                 self._logger.setLevel(DEFAULT_LOG_LEVEL)
     
-    def debug(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def debug(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log message at DEBUG level with context information.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -288,16 +294,21 @@ class StructuredLogger:
             context.update(extra)
         
         # Log message at DEBUG level with merged context
-        self._logger.debug(message, extra=context)
+        self._logger.debug(message, *args, extra=context)
     
-    def info(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def info(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log message at INFO level with context information.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -306,16 +317,21 @@ class StructuredLogger:
             context.update(extra)
         
         # Log message at INFO level with merged context
-        self._logger.info(message, extra=context)
+        self._logger.info(message, *args, extra=context)
     
-    def warning(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def warning(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log message at WARNING level with context information.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -324,16 +340,21 @@ class StructuredLogger:
             context.update(extra)
         
         # Log message at WARNING level with merged context
-        self._logger.warning(message, extra=context)
+        self._logger.warning(message, *args, extra=context)
     
-    def error(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def error(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log message at ERROR level with context information.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -342,16 +363,21 @@ class StructuredLogger:
             context.update(extra)
         
         # Log message at ERROR level with merged context
-        self._logger.error(message, extra=context)
+        self._logger.error(message, *args, extra=context)
     
-    def critical(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def critical(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log message at CRITICAL level with context information.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.CRITICAL):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -360,16 +386,21 @@ class StructuredLogger:
             context.update(extra)
         
         # Log message at CRITICAL level with merged context
-        self._logger.critical(message, extra=context)
+        self._logger.critical(message, *args, extra=context)
     
-    def exception(self, message: str, extra: Optional[Dict[str, Any]] = None) -> None:
+    def exception(self, message: str, *args: Any, extra: Optional[Dict[str, Any]] = None) -> None:
         """
         Log exception at ERROR level with context information and stack trace.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
+            args: Values merged into the message only when the record is emitted
             extra: Additional contextual information
         """
+        # Skip context gathering and formatting when the level is disabled
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
+        
         # Get context data
         context = get_context_data()
         
@@ -383,7 +414,7 @@ class StructuredLogger:
             context['exception'] = exc_formatted
         
         # Log message at ERROR level with merged context and exc_info=True
-        self._logger.exception(message, extra=context)
+        self._logger.exception(message, *args, extra=context)
     
     def set_level(self, level: int) -> None:
         """
@@ -3,6 +3,7 @@ Repository for the Site entity that provides data access operations with transac
 Handles CRUD operations for site records and manages relationships between sites, users, and interactions.
 """
 
+from datetime import datetime
 from typing import List, Dict, Any, Tuple, Optional
 import sqlalchemy
 from sqlalchemy import func, or_
@@ -204,9 +205,10 @@ class SiteRepository(BaseRepository):
         Returns:
             List[Dict]: List of site objects with access role information
         """
-        # Create query joining Site and UserSite
+        # Create query joining Site and UserSite, selecting plain columns so rows are not
+        # hydrated into Site instances and tracked by the session
         query = self.get_session().query(
-            Site, UserSite.role
+            *Site.__table__.columns, UserSite.role
         ).join(
             UserSite, UserSite.site_id == Site.id
         ).filter(
@@ -216,11 +218,13 @@ class SiteRepository(BaseRepository):
         # Execute query
         results = query.all()
         
-        # Format results as list of dictionaries with role information
+        # Format results as list of dictionaries with role information, matching Site.to_dict
         sites_with_roles = []
-        for site, role in results:
-            site_dict = site.to_dict()
-            site_dict['role'] = role
+        for row in results:
+            site_dict = {
+                key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row._mapping.items()
+            }
             sites_with_roles.append(site_dict)
         
         logger.debug(f"Retrieved {len(sites_with_roles)} sites for user ID: {user_id}")
@@ -315,6 +319,28 @@ class SiteRepository(BaseRepository):
         logger.debug(f"User {user_id} access to site {site_id}: {has_access}")
         return has_access
     
+    def find_by_id_for_user(self, user_id: int, site_id: int) -> Optional[Site]:
+        """
+        Find a site by ID only if the user has access to it, in a single query.
+        
+        Args:
+            user_id: ID of the user
+            site_id: ID of the site
+            
+        Returns:
+            Site: Site instance if it exists and the user has access, None otherwise
+        """
+        # Join Site to UserSite so the access check and the lookup share one round trip
+        site = self.get_session().query(Site).join(
+            UserSite, UserSite.site_id == Site.id
+        ).filter(
+            Site.id == site_id,
+            UserSite.user_id == user_id
+        ).first()
+        
+        logger.debug(f"Site {site_id} lookup for user {user_id}: {'found' if site else 'not found or no access'}")
+        return site
+    
     def get_user_role_for_site(self, user_id: int, site_id: int) -> Optional[str]:
         """
         Get a user's role for a specific site.
@@ -8,7 +8,8 @@ from typing import Dict, List, Optional, Union, Any, Tuple
 import datetime
 from datetime import datetime
 import hashlib
-import json
+
+import orjson  # version 3.9.2
 
 from ..repositories.interaction_repository import InteractionRepository
 from ..auth.site_context_service import SiteContextService
@@ -36,21 +37,16 @@ def generate_query_hash(query: str, filters: Dict[str, Any]) -> str:
         filters: Dictionary of filter criteria
 
     Returns:
-        MD5 hash string representing the query parameters
+        BLAKE2b hash string representing the query parameters
     """
     try:
-        # Sort filter keys to ensure consistent order
-        sorted_filter_keys = sorted(filters.keys())
-        sorted_filters = {key: filters[key] for key in sorted_filter_keys}
-
-        # Serialize filters to JSON string
-        filter_str = json.dumps(sorted_filters, sort_keys=True)
-
-        # Combine query string and serialized filters
-        combined = f"{query}:{filter_str}"
+        # Serialize filters to JSON with sorted keys to ensure consistent order
+        filter_bytes = orjson.dumps(filters, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
 
-        # Generate MD5 hash of the combined string
-        hash_object = hashlib.md5(combined.encode('utf-8'))
+        # Generate a 128-bit BLAKE2b hash of "query:filters", fed in parts
+        hash_object = hashlib.blake2b(query.encode('utf-8'), digest_size=16)
+        hash_object.update(b':')
+        hash_object.update(filter_bytes)
         hash_str = hash_object.hexdigest()
 
         # Return hexadecimal digest of the hash
@@ -300,6 +300,9 @@ class UserService:
             # Delegate to user_repository.update_user() with user_id and data
             user = self._user_repository.update_user(user_id, user_data)
 
+            # Drop the cached user context so authentication picks up the change
+            self._user_context_service.invalidate_user_context(user_id)
+
             # Handle site associations if site_ids provided
             # Apply specific roles to sites if site_roles is provided
             # TODO: Implement site association and role assignment logic
@@ -352,6 +355,10 @@ class UserService:
             # Delegate to user_repository.delete_user() with user_id
             result = self._user_repository.delete_user(user_id)
 
+            # Drop the cached user context so the deleted user can no longer authenticate
+            if result:
+                self._user_context_service.invalidate_user_context(user_id)
+
             # Return True on success
             return result
         except AuthorizationError as e:
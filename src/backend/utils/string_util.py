@@ -16,6 +16,7 @@ Functions provide capabilities for:
 
 import re
 import html
+import hashlib
 import bleach  # version 6.0.0
 import unicodedata
 from typing import Optional, List, Dict, Any
@@ -312,4 +313,17 @@ def format_name(name: Optional[str]) -> Optional[str]:
             words[i] = word.capitalize()
     
     # Join the words back together with spaces
-    return ' '.join(words)
\ No newline at end of file
+    return ' '.join(words)
+
+
+def token_digest(token: str) -> bytes:
+    """
+    Computes a fixed-size digest of a token for use in cache keys.
+    
+    Args:
+        token: JWT or opaque access token
+        
+    Returns:
+        16-byte BLAKE2b digest of the token
+    """
+    return hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()